@@ -7,25 +7,29 @@ into the glc_control package for better maintainability and testability.
 """
 
 import time
-from glc_control import (
-    parse_args,
-    find_device,
-    setup_device,
-    get_endpoint,
-    set_rgb_color,
-    send_h264_frame,
-    load_background,
-    create_frame,
-    encode_h264,
-    cleanup_device,
-    MatrixPreset,
-    HeartbeatPreset,
-)
+from glc_control import parse_args
 
 
 def main() -> None:
     args = parse_args()
 
+    # Imported after argument parsing so --help stays fast
+    from glc_control import (
+        find_device,
+        setup_device,
+        get_endpoint,
+        set_rgb_color,
+        send_h264_frame,
+        load_background,
+        make_renderer,
+        encode_h264,
+        close_encoder,
+        cleanup_device,
+        MatrixPreset,
+        HeartbeatPreset,
+    )
+    from glc_control.config import FRAME_RESEND_INTERVAL_S
+
     rgb_color = args.rgb
     frame_delay = 1.0 / args.fps
     show_overlay = not args.no_overlay
@@ -81,21 +85,41 @@ def main() -> None:
     else:
         set_rgb_color(endpoint, rgb_color)
 
+    # Pick the frame source once: preset animation or standard overlay renderer
+    if preset:
+        render = preset.render
+    else:
+        render = make_renderer(bg_image, show_overlay, overlay_opacity)
+
+    # Last payload sent to the display, used to skip resending unchanged frames
+    last_h264 = None
+    last_sent_at = 0.0
+
     try:
-        while True:
-            if preset:
-                # Use preset rendering
-                img = preset.render()
-            else:
-                # Use standard frame rendering
-                img = create_frame(bg_image, show_overlay, overlay_opacity)
-            
-            h264_data = encode_h264(img)
+        # Frames are paced against monotonic deadlines so render/encode/send
+        # time is absorbed into the frame period instead of added to it
+        next_deadline = time.monotonic()
 
-            if h264_data:
+        while True:
+            img = render()
+
+            # encode_h264 returns its cached payload when nothing changed on
+            # screen (e.g. clock hasn't ticked yet); skip the USB transfer
+            # then, but still refresh periodically
+            h264_data = encode_h264(img, args.encode_scale)
+            now = time.monotonic()
+            if h264_data and (h264_data != last_h264 or now - last_sent_at >= FRAME_RESEND_INTERVAL_S):
                 send_h264_frame(endpoint, h264_data)
+                last_h264 = h264_data
+                last_sent_at = now
 
-            time.sleep(frame_delay)
+            next_deadline += frame_delay
+            sleep_time = next_deadline - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                # Running behind: resync instead of bursting to catch up
+                next_deadline = time.monotonic()
 
     except KeyboardInterrupt:
         print("\n\n⏹️  Stopping by user...")
@@ -116,6 +140,7 @@ def main() -> None:
             cleanup_device(device)
         except:
             pass
+        close_encoder()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 """GAII Control - Lian Li Galahad II LCD control for Linux."""
 
+import importlib
+from typing import Any
+
 from .config import (
     VENDOR_ID,
     PRODUCT_ID,
@@ -15,16 +18,41 @@ from .config import (
 )
 from .cli import parse_color, parse_args, create_parser
 from .config_loader import load_config, find_config_file, create_config_example
-from .image_processor import encode_h264, load_background, create_frame
-from .presets import Preset, MatrixPreset, HeartbeatPreset
-from .usb_device import (
-    find_device,
-    setup_device,
-    get_endpoint,
-    send_h264_frame,
-    set_rgb_color,
-    cleanup_device,
-)
+
+# Rendering, encoding and USB helpers pull in PIL, PyAV, psutil and pyusb.
+# They are imported on first attribute access (PEP 562) so that CLI-only
+# use such as ``--help`` does not pay for them.
+_LAZY_IMPORTS: dict[str, str] = {
+    "encode_h264": ".image_processor",
+    "encode_h264_batch": ".image_processor",
+    "close_encoder": ".image_processor",
+    "load_background": ".image_processor",
+    "create_frame": ".image_processor",
+    "make_renderer": ".image_processor",
+    "Preset": ".presets",
+    "MatrixPreset": ".presets",
+    "HeartbeatPreset": ".presets",
+    "find_device": ".usb_device",
+    "setup_device": ".usb_device",
+    "get_endpoint": ".usb_device",
+    "send_h264_frame": ".usb_device",
+    "set_rgb_color": ".usb_device",
+    "cleanup_device": ".usb_device",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "1.0.0"
 __all__ = [
@@ -50,8 +78,11 @@ __all__ = [
     "create_config_example",
     # Image Processing
     "encode_h264",
+    "encode_h264_batch",
+    "close_encoder",
     "load_background",
     "create_frame",
+    "make_renderer",
     # Presets
     "Preset",
     "MatrixPreset",
@@ -1,14 +1,51 @@
 """Command-line interface for gaii-control."""
 
 import argparse
+import functools
+import re
 from typing import Tuple, Any
-from .config import DEFAULT_RGB_COLOR, DEFAULT_FPS, DEFAULT_BG_MODE, DEFAULT_OVERLAY_OPACITY, SCALING_MODES
+from .config import (
+    DEFAULT_RGB_COLOR,
+    DEFAULT_FPS,
+    DEFAULT_BG_MODE,
+    DEFAULT_OVERLAY_OPACITY,
+    DEFAULT_ENCODE_SCALE,
+    SCALING_MODES,
+    COLOR_TEMPLATES,
+)
 from .config_loader import load_config, find_config_file
 
+# Available color names for error messages (built once at import)
+_AVAILABLE_COLORS = ", ".join(sorted(COLOR_TEMPLATES))
 
+# Config file key -> (argument attribute, argument default)
+_CONFIG_MAPPINGS: Tuple[Tuple[str, str, Any], ...] = (
+    ("rgb", "rgb", DEFAULT_RGB_COLOR),
+    ("fps", "fps", DEFAULT_FPS),
+    ("bg", "bg", None),
+    ("background", "bg", None),  # Alias
+    ("bg_mode", "bg_mode", DEFAULT_BG_MODE),
+    ("overlay_opacity", "overlay_opacity", DEFAULT_OVERLAY_OPACITY),
+    ("encode_scale", "encode_scale", DEFAULT_ENCODE_SCALE),
+)
+
+_MISSING = object()
+
+# Hex (#RRGGBB / RRGGBB) or r,g,b color formats, matched in a single pass.
+# Leading zeros in r,g,b components are skipped, as int() would accept them.
+_COLOR_RE = re.compile(
+    r"#?(?P<hex>[0-9a-f]{6})|0*(?P<r>\d{1,3})\s*,\s*0*(?P<g>\d{1,3})\s*,\s*0*(?P<b>\d{1,3})",
+    re.ASCII | re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=256)
 def parse_color(color_str: str) -> Tuple[int, int, int]:
     """Parse color from name, hex (#RRGGBB or RRGGBB), or r,g,b format.
     
+    Results are memoized per input string; invalid input is not cached and
+    raises on every call.
+    
     Args:
         color_str: Color string in name, hex, or RGB format
         
@@ -18,41 +55,31 @@ def parse_color(color_str: str) -> Tuple[int, int, int]:
     Raises:
         argparse.ArgumentTypeError: If color format is invalid
     """
-    from .config import COLOR_TEMPLATES
-    
     color_str = color_str.strip()
-    color_lower = color_str.lower()
     
-    # Check for named color first
-    if color_lower in COLOR_TEMPLATES:
-        return COLOR_TEMPLATES[color_lower]
+    # Check for named color first; names are stored lowercase, so only
+    # lowercase a string that missed as typed
+    color = COLOR_TEMPLATES.get(color_str)
+    if color is None:
+        color = COLOR_TEMPLATES.get(color_str.lower())
+    if color is not None:
+        return color
     
-    # Hex format: #RRGGBB or RRGGBB
-    hex_str = color_str
-    if hex_str.startswith("#"):
-        hex_str = hex_str[1:]
-    if len(hex_str) == 6:
-        try:
-            r = int(hex_str[0:2], 16)
-            g = int(hex_str[2:4], 16)
-            b = int(hex_str[4:6], 16)
+    match = _COLOR_RE.fullmatch(color_str)
+    if match:
+        hex_str = match.group("hex")
+        if hex_str:
+            # Hex format: #RRGGBB or RRGGBB
+            rgb = bytes.fromhex(hex_str)
+            return (rgb[0], rgb[1], rgb[2])
+        
+        # RGB format: r,g,b
+        r, g, b = int(match.group("r")), int(match.group("g")), int(match.group("b"))
+        if r <= 255 and g <= 255 and b <= 255:
             return (r, g, b)
-        except ValueError:
-            pass
-
-    # RGB format: r,g,b
-    if "," in color_str:
-        try:
-            parts = [int(x.strip()) for x in color_str.split(",")]
-            if len(parts) == 3 and all(0 <= x <= 255 for x in parts):
-                return (parts[0], parts[1], parts[2])
-        except ValueError:
-            pass
 
-    # Build list of available color names for error message
-    available_colors = ", ".join(sorted(COLOR_TEMPLATES.keys()))
     raise argparse.ArgumentTypeError(
-        f"Invalid color '{color_str}'. Use a color name ({available_colors}), hex (#00FF00), or RGB (0,255,0)"
+        f"Invalid color '{color_str}'. Use a color name ({_AVAILABLE_COLORS}), hex (#00FF00), or RGB (0,255,0)"
     )
 
 
@@ -128,6 +155,13 @@ Preset mode examples:
         metavar="0-255",
         help=f"Overlay background opacity (0=transparent, 255=solid) (default: {DEFAULT_OVERLAY_OPACITY})",
     )
+    parser.add_argument(
+        "--encode-scale",
+        type=float,
+        default=DEFAULT_ENCODE_SCALE,
+        metavar="SCALE",
+        help=f"Encode frames at this fraction of 480x480, e.g. 0.5 for 240x240 (default: {DEFAULT_ENCODE_SCALE})",
+    )
     parser.add_argument(
         "--preset",
         type=str,
@@ -165,6 +199,16 @@ def parse_args(argv: list[str] | None = None, load_config_file: bool = True) ->
             except Exception as e:
                 print(f"Warning: Failed to load config file: {e}")
     
+    # Validate encode scale after the merge so config file values are covered
+    try:
+        encode_scale = float(args.encode_scale)
+    except (TypeError, ValueError):
+        print(f"Warning: Invalid encode_scale {args.encode_scale!r}, using {DEFAULT_ENCODE_SCALE}")
+        encode_scale = DEFAULT_ENCODE_SCALE
+    args.encode_scale = max(0.1, min(1.0, encode_scale))
+    if args.encode_scale != encode_scale:
+        print(f"Warning: encode_scale {encode_scale} out of range, using {args.encode_scale}")
+    
     return args
 
 
@@ -178,31 +222,21 @@ def _apply_config_to_args(args: argparse.Namespace, config: dict[str, Any]) -> N
         args: argparse.Namespace to modify
         config: Configuration dictionary from file
     """
-    # Map config keys to argument attributes
-    mappings = [
-        ("rgb", "rgb", DEFAULT_RGB_COLOR),
-        ("fps", "fps", DEFAULT_FPS),
-        ("bg", "bg", None),
-        ("background", "bg", None),  # Alias
-        ("bg_mode", "bg_mode", DEFAULT_BG_MODE),
-        ("overlay_opacity", "overlay_opacity", DEFAULT_OVERLAY_OPACITY),
-    ]
-    
-    for config_key, arg_attr, default_value in mappings:
-        if config_key in config:
-            config_val = config[config_key]
-            
-            # Special handling for rgb color strings
-            if config_key == "rgb" and isinstance(config_val, str):
-                try:
-                    config_val = parse_color(config_val)
-                except argparse.ArgumentTypeError:
-                    continue
-            
-            # Only apply config value if CLI arg has default value
-            current_val = getattr(args, arg_attr, None)
-            if current_val == default_value or (config_key == "bg" and current_val is None):
-                setattr(args, arg_attr, config_val)
+    for config_key, arg_attr, default_value in _CONFIG_MAPPINGS:
+        config_val = config.get(config_key, _MISSING)
+        if config_val is _MISSING:
+            continue
+        
+        # Special handling for rgb color strings
+        if config_key == "rgb" and isinstance(config_val, str):
+            try:
+                config_val = parse_color(config_val)
+            except argparse.ArgumentTypeError:
+                continue
+        
+        # Only apply config value if CLI arg has default value
+        if getattr(args, arg_attr, None) == default_value:
+            setattr(args, arg_attr, config_val)
     
     # Handle boolean overlay option (inverted)
     if "overlay" in config:
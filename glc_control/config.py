@@ -1,6 +1,7 @@
 """Configuration constants for gaii-control."""
 
-from typing import Tuple, Dict
+from types import MappingProxyType
+from typing import Tuple, Dict, Mapping
 
 # USB Device identifiers
 VENDOR_ID: int = 0x0416
@@ -22,6 +23,13 @@ DEFAULT_FPS: float = 5.0
 DEFAULT_BG_MODE: str = "fill"
 DEFAULT_OVERLAY_OPACITY: int = 180
 
+# Encoder input size relative to DISPLAY_SIZE (1.0 = native 480x480).
+# Lower values cut encoder work but rely on the display upscaling.
+DEFAULT_ENCODE_SCALE: float = 1.0
+
+# Unchanged frames are not re-sent, but the display is refreshed at least this often
+FRAME_RESEND_INTERVAL_S: float = 1.0
+
 # Text rendering positions (x, y) for 480x480 display
 TEXT_POSITIONS: Dict[str, Tuple[int, int]] = {
     "cpu_temp": (60, 100),
@@ -43,8 +51,8 @@ COLOR_ORANGE: Tuple[int, int, int] = (255, 160, 0)
 COLOR_BRIGHT_CYAN: Tuple[int, int, int] = (0, 255, 200)
 COLOR_GRAY: Tuple[int, int, int] = (120, 120, 120)
 
-# Named color templates (16 standard colors)
-COLOR_TEMPLATES: Dict[str, Tuple[int, int, int]] = {
+# Named color templates (16 standard colors), read-only
+COLOR_TEMPLATES: Mapping[str, Tuple[int, int, int]] = MappingProxyType({
     # Basic colors (8)
     "black": (0, 0, 0),
     "red": (255, 0, 0),
@@ -64,7 +72,7 @@ COLOR_TEMPLATES: Dict[str, Tuple[int, int, int]] = {
     "bright_magenta": (255, 64, 255),
     "bright_cyan": (64, 255, 255),
     "bright_white": (255, 255, 255),
-}
+})
 
 # USB Protocol constants
 class USBProtocol:
@@ -103,8 +111,60 @@ class VideoPacket:
     CHUNK_LEN_B0 = 10  # Low byte
     PAYLOAD = 11
 
+# H.264 encoders in order of preference. Hardware encoders that cannot be
+# opened on this machine (no GPU/driver) are skipped in favour of libx264.
+# V4L2 M2M runs an asynchronous pipeline and has not been checked on real
+# hardware for one packet per frame, so it is only a fallback for builds
+# without libx264; move it to the front to prefer it on an SBC.
+H264_ENCODERS: list[str] = ["h264_nvenc", "libx264", "h264_v4l2m2m"]
+
+# H.264 profile set on every encoder's codec context (the LCD decoder only
+# handles baseline); encoders without a profile option of their own use it
+H264_PROFILE: str = "Baseline"
+
+# Low-latency options per encoder (baseline profile for the LCD decoder)
+H264_ENCODER_OPTIONS: Dict[str, Dict[str, str]] = {
+    # V4L2 memory-to-memory (Raspberry Pi, Rockchip, ...): GOP size,
+    # B-frames and profile come from the codec context; FFmpeg repeats
+    # SPS/PPS itself. Hardware encoders have no x264-style "preset=ultrafast".
+    "h264_v4l2m2m": {},
+    "h264_nvenc": {
+        "preset": "p1",
+        "tune": "ull",
+        "zerolatency": "1",
+        "profile": "baseline",
+        "rc": "constqp",
+        "qp": "25",
+        "forced-idr": "1",
+        # No output delay: each packet is returned by the encode() call that
+        # submitted its frame instead of trailing it by a few frames
+        "delay": "0",
+    },
+    "libx264": {
+        "preset": "ultrafast",
+        "tune": "zerolatency",
+        "profile": "baseline",
+        "level": "3.0",
+        "crf": "25",
+        # Intra-only with repeated headers: one self-contained frame per call
+        "x264-params": "cabac=0:ref=1:deblock=0:0:0:analyse=0:0:me=dia:subme=0:keyint=1:keyint_min=1:scenecut=0:bframes=0:mbtree=0:repeat-headers=1",
+    },
+}
+
 # Temperature sensor names (system-dependent)
 TEMP_SENSORS: list[str] = ["coretemp", "k10temp"]
 
+# sysfs directory with hardware monitoring devices (CPU temperature source)
+HWMON_PATH: str = "/sys/class/hwmon"
+
+# Minimum seconds between CPU temperature sensor reads
+TEMP_REFRESH_INTERVAL_S: float = 1.0
+
+# Minimum seconds between CPU usage reads (/proc/stat ticks at ~100 Hz)
+CPU_REFRESH_INTERVAL_S: float = 0.1
+
 # Image scaling modes
 SCALING_MODES: list[str] = ["stretch", "fit", "fill"]
+
+# Resample backgrounds with Lanczos instead of the faster bilinear filter
+HIGH_QUALITY_BG: bool = False
@@ -8,6 +8,12 @@ from typing import Any, Dict, Tuple
 import os
 import sys
 
+# Prefer the Rust-backed rtoml parser when installed (faster startup)
+try:
+    import rtoml  # type: ignore
+except ImportError:
+    rtoml = None  # type: ignore
+
 # Try to import tomllib (Python 3.11+) or tomli (fallback)
 try:
     import tomllib
@@ -18,23 +24,40 @@ except ImportError:
         tomllib = None  # type: ignore
 
 
+# Searched in order; "~" is expanded on first lookup, not at import
 DEFAULT_CONFIG_PATHS: list[str] = [
-    os.path.expanduser("~/.config/gaii-control/config.toml"),
-    os.path.expanduser("~/gaii-control.toml"),
+    "~/.config/gaii-control/config.toml",
+    "~/gaii-control.toml",
     "./gaii-control.toml",
 ]
 
+_UNSET = object()
 
-def find_config_file() -> str | None:
+# Result of the first find_config_file() lookup in this process
+_found_config: Any = _UNSET
+
+
+def find_config_file(refresh: bool = False) -> str | None:
     """Find the first existing config file from default locations.
     
+    The result is cached for the lifetime of the process.
+    
+    Args:
+        refresh: Ignore the cached result and search again
+    
     Returns:
         Path to config file if found, None otherwise
     """
-    for path in DEFAULT_CONFIG_PATHS:
-        if os.path.exists(path):
-            return path
-    return None
+    global _found_config
+    
+    if _found_config is _UNSET or refresh:
+        _found_config = None
+        for path in DEFAULT_CONFIG_PATHS:
+            path = os.path.expanduser(path)
+            if os.path.exists(path):
+                _found_config = path
+                break
+    return _found_config
 
 
 def load_config(config_path: str | None = None) -> Dict[str, Any]:
@@ -49,7 +72,7 @@ def load_config(config_path: str | None = None) -> Dict[str, Any]:
     Raises:
         RuntimeError: If TOML support is not available
     """
-    if tomllib is None:
+    if rtoml is None and tomllib is None:
         raise RuntimeError(
             "TOML support not available. Install 'tomli' package for Python < 3.11"
         )
@@ -63,7 +86,10 @@ def load_config(config_path: str | None = None) -> Dict[str, Any]:
     # Load config file
     try:
         with open(config_path, "rb") as f:
-            config_data = tomllib.load(f)
+            if rtoml is not None:
+                config_data = rtoml.loads(f.read().decode("utf-8"))
+            else:
+                config_data = tomllib.load(f)
         
         # Extract gaii-control section if present
         if "gaii-control" in config_data:
@@ -79,53 +105,6 @@ def load_config(config_path: str | None = None) -> Dict[str, Any]:
         return {}
 
 
-def merge_config_with_args(
-    config: Dict[str, Any], cli_args: Any
-) -> Dict[str, Any]:
-    """Merge configuration file values with CLI arguments.
-    
-    CLI arguments take precedence over config file values.
-    
-    Args:
-        config: Configuration from file
-        cli_args: argparse.Namespace from CLI parsing
-        
-    Returns:
-        Merged configuration dictionary
-    """
-    merged: Dict[str, Any] = {**config}
-    
-    # Map config file keys to CLI argument names
-    key_mapping = {
-        "rgb": "rgb",
-        "fps": "fps",
-        "bg": "bg",
-        "background": "bg",  # Alias support
-        "bg_mode": "bg_mode",
-        "overlay": "no_overlay",  # Note: inverted
-        "overlay_opacity": "overlay_opacity",
-    }
-    
-    # Override with CLI values if they were explicitly provided
-    for config_key, arg_key in key_mapping.items():
-        if hasattr(cli_args, arg_key):
-            arg_value = getattr(cli_args, arg_key)
-            
-            # Special handling for 'overlay' (inverted logic)
-            if config_key == "overlay":
-                # If user specified --no-overlay on CLI, don't override with config
-                if cli_args.no_overlay is not True:  # type: ignore
-                    merged["overlay"] = config.get("overlay", True)
-            else:
-                # Don't override if CLI arg is at its default value
-                # This is a heuristic; a better approach would track explicitly
-                # provided args, but this is a good compromise
-                if arg_value is not None:
-                    merged[arg_key] = arg_value
-    
-    return merged
-
-
 def create_config_example(output_path: str) -> None:
     """Create an example configuration file.
     
@@ -155,6 +134,9 @@ overlay = true
 # Overlay background opacity (0=transparent, 255=solid)
 overlay_opacity = 180
 
+# Encoder input scale (1.0 = native 480x480, 0.5 = 240x240 for less CPU)
+encode_scale = 1.0
+
 # Examples:
 # rgb = "#FF0000"        # Red
 # rgb = "0,255,0"        # Green
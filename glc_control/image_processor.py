@@ -1,12 +1,13 @@
 """Image processing and frame rendering for gaii-control."""
 
-from typing import Any, Dict, Tuple, Optional
-import subprocess
+from typing import Any, Callable, Dict, Iterable, Tuple, Optional
+import atexit
+import functools
 import os
-import io
 import av
+from fractions import Fraction
 from PIL import Image, ImageDraw, ImageFont
-from datetime import datetime
+import time
 import psutil
 
 from .config import (
@@ -19,87 +20,241 @@ from .config import (
     COLOR_ORANGE,
     COLOR_BRIGHT_CYAN,
     COLOR_GRAY,
-    TEMP_SENSORS,
+    TEMP_REFRESH_INTERVAL_S,
+    CPU_REFRESH_INTERVAL_S,
+    H264_ENCODERS,
+    H264_ENCODER_OPTIONS,
+    H264_PROFILE,
     SCALING_MODES,
+    HIGH_QUALITY_BG,
+    DEFAULT_ENCODE_SCALE,
 )
+from .render_utils import draw_text, find_font, read_cpu_temp
 
-# Global encoder instance for reuse (massive performance improvement)
+# Global encoder instance for reuse (opened lazily by encode_h264)
 _h264_encoder: Optional[Any] = None
-_encoder_output_buffer: Optional[io.BytesIO] = None
+_h264_frame_index: int = 0
+_h264_encode_size: Optional[Tuple[int, int]] = None
 
-# Global font cache to avoid repeated fc-match subprocess calls
-_font_cache: Dict[str, Optional[str]] = {}
+# Last encoded frame, returned as-is when the next image is pixel-identical
+_last_frame_key: Optional[Tuple[str, Tuple[int, int], bytes]] = None
+_last_h264: bytes = b""
+_h264_atexit_registered: bool = False
+
+# Loaded overlay fonts keyed by (font path, size)
 _loaded_fonts: Dict[Tuple[str, int], Any] = {}
 
+# Resolved overlay fonts, built once on the first overlay frame
+_overlay_fonts: Optional[Dict[str, Any]] = None
+
 # Background image cache
 _bg_image_cache: Optional[Image.Image] = None
 _bg_image_cache_key: Optional[str] = None
 
+# Pre-rendered dark theme background (used when no image is provided)
+_dark_bg_image: Optional[Image.Image] = None
+
+# Background with the date already drawn, rebuilt when the day or base changes
+_static_frame: Optional[Image.Image] = None
+_static_frame_base: Optional[Image.Image] = None
+_static_frame_date: str = ""
+
+# Reusable overlay frame buffer and its draw context (allocated once)
+_frame_img: Optional[Image.Image] = None
+_frame_draw: Optional[ImageDraw.ImageDraw] = None
+
+# Image the buffer was last filled from, and boxes drawn on top of it since
+_frame_source: Optional[Image.Image] = None
+_frame_dirty: list[Tuple[int, int, int, int]] = []
+
+# Formatted clock strings, refreshed when the wall-clock second changes.
+# Local time is only looked up once per minute; seconds come from a table.
+_last_clock_second: int = -1
+_last_clock_minute: int = -1
+_last_time_prefix: str = ""
+_last_time_text: str = ""
+_last_date_text: str = ""
+_SECOND_TEXTS: Tuple[str, ...] = tuple(f"{s:02d}" for s in range(60))
+
 # CPU metrics cache for smoothing
 _last_cpu_percent: float = 0.0
+_last_cpu_ts: Optional[float] = None
+
+# Prime psutil's CPU counters so the first overlay frame reports a real value
+# instead of 0%. All later reads must stay non-blocking (interval=None).
+psutil.cpu_percent(interval=None)
+
+# CPU temperature cache (sensors change on second scales, not per frame)
+_last_temp_ts: Optional[float] = None
+_last_temp_str: str = "N/A"
+
+
+def _get_encode_size(scale: float) -> Tuple[int, int]:
+    """Return the encoder frame size for a given scale of DISPLAY_SIZE.
+    
+    Args:
+        scale: Fraction of the display resolution (1.0 = native)
+        
+    Returns:
+        tuple: (width, height), rounded down to even numbers for yuv420p
+    """
+    return tuple(max(2, int(side * scale) & ~1) for side in DISPLAY_SIZE)
 
 
-def encode_h264(image: Image.Image) -> bytes:
-    """Encode PIL Image to H.264 format using PyAV (in-memory, no subprocess).
+def _open_h264_encoder(size: Tuple[int, int] = DISPLAY_SIZE) -> Any:
+    """Create and open the persistent H.264 codec context.
     
-    This is a massive performance improvement over the old FFmpeg subprocess method:
-    - No process spawning (saves ~100-200ms per frame)
-    - No temp file I/O (saves ~10-20ms per frame)
-    - Direct memory encoding
+    Encoders from H264_ENCODERS are tried in order, so NVENC is used on
+    NVIDIA GPUs and libx264 otherwise (V4L2 M2M only when libx264 is
+    missing). Every frame is encoded as a standalone baseline-profile IDR
+    picture, keeping each payload sent to the LCD independently decodable.
+    
+    Args:
+        size: Encoded frame size (width, height)
+        
+    Returns:
+        av.CodecContext: Opened encoder ready for ``encode()`` calls
+        
+    Raises:
+        RuntimeError: If none of the configured encoders can be opened
+    """
+    errors = []
+    for codec_name in H264_ENCODERS:
+        if codec_name not in av.codecs_available:
+            # Not compiled into this FFmpeg build; skip without probing
+            errors.append(f"{codec_name}: not available")
+            continue
+        try:
+            ctx = av.CodecContext.create(codec_name, 'w')
+            ctx.width, ctx.height = size
+            ctx.pix_fmt = 'yuv420p'
+            ctx.time_base = Fraction(1, 1)
+            ctx.gop_size = 1
+            ctx.max_b_frames = 0
+            ctx.profile = H264_PROFILE
+            ctx.options = dict(H264_ENCODER_OPTIONS.get(codec_name, {}))
+            ctx.open()
+            return ctx
+        except Exception as e:
+            # Encoder not built into FFmpeg or no usable device/driver
+            errors.append(f"{codec_name}: {e}")
+    
+    raise RuntimeError(f"No usable H.264 encoder ({'; '.join(errors)})")
+
+
+def encode_h264(image: Image.Image, scale: float = DEFAULT_ENCODE_SCALE) -> bytes:
+    """Encode PIL Image to H.264 format using a persistent PyAV encoder.
+    
+    The codec context (the first usable encoder from H264_ENCODERS) is
+    created once on first use and reused for every subsequent frame,
+    avoiding per-frame encoder initialization, SPS/PPS setup and container
+    muxing. With the low-latency H264_ENCODER_OPTIONS and no B-frames each
+    input frame yields its packet immediately; an encoder that still buffers
+    the frame is drained (and reopened on the next call), so the payload
+    always belongs to ``image``. The encoder is flushed and released at
+    interpreter exit if ``close_encoder()`` was not called.
+    
+    Encoding a pixel-identical image again (e.g. several ticks within the
+    same clock second) returns the previous payload without touching the
+    encoder; every payload is a standalone keyframe, so resending it is valid.
     
     Args:
         image: PIL Image object to encode
+        scale: Encode at this fraction of DISPLAY_SIZE (1.0 = native). The
+            downscale happens in the same swscale pass as the YUV conversion.
         
     Returns:
-        bytes: H.264 encoded video data
+        bytes: H.264 encoded video data (Annex B)
     """
-    # Create in-memory output buffer
-    output_buffer = io.BytesIO()
-    
-    # Create output container in memory
-    container = av.open(output_buffer, mode='w', format='h264')
-    
-    # Add video stream with optimized settings for low latency
-    stream = container.add_stream('libx264', rate=1)
-    stream.width = DISPLAY_SIZE[0]
-    stream.height = DISPLAY_SIZE[1]
-    stream.pix_fmt = 'yuv420p'
-    
-    # Ultra-fast encoding settings matching the original ffmpeg parameters
-    stream.options = {
-        'preset': 'ultrafast',
-        'tune': 'zerolatency',
-        'profile': 'baseline',
-        'level': '3.0',
-        'crf': '25',
-        # Matching x264-params from original
-        'x264-params': 'cabac=0:ref=1:deblock=0:0:0:analyse=0:0:me=dia:subme=0:keyint=24:keyint_min=2:scenecut=0:bframes=0:mbtree=0',
-    }
+    global _h264_encoder, _h264_frame_index, _h264_atexit_registered, _h264_encode_size
+    global _last_frame_key, _last_h264
     
-    # Convert PIL Image to VideoFrame
+    size = _get_encode_size(scale)
+    if size != _h264_encode_size:
+        # Scale changed: the encoder's frame size is fixed once opened, and the
+        # cached payload was encoded at the old size
+        close_encoder()
+        _h264_encode_size = size
+    
+    frame_key = (image.mode, image.size, image.tobytes())
+    if frame_key == _last_frame_key:
+        return _last_h264
+    
+    if _h264_encoder is None:
+        _h264_encoder = _open_h264_encoder(size)
+        _h264_frame_index = 0
+        if not _h264_atexit_registered:
+            atexit.register(close_encoder)
+            _h264_atexit_registered = True
+    
+    # Hand raw pixels to the encoder (no PNG or other file format in between);
+    # the codec context rescales to the encode size in yuv420p. The RGB->YUV420
+    # step runs in libswscale's SIMD code, which is about twice as fast as
+    # building the planes with Pillow (convert("YCbCr") + BOX subsampling)
     frame = av.VideoFrame.from_image(image)
+    frame.pts = _h264_frame_index
+    _h264_frame_index += 1
     
-    # Encode the frame
-    for packet in stream.encode(frame):
-        container.mux(packet)
+    # No intermediate BytesIO/container: each packet is copied out of its
+    # AVPacket exactly once, and joining the usual single packet returns
+    # that bytes object itself rather than another copy
+    packets = _h264_encoder.encode(frame)
+    if not packets:
+        # The encoder held the frame back (lookahead or an async hardware
+        # pipeline). Drain it so the payload belongs to this frame rather than
+        # arriving with the next one; a flushed context takes no more input,
+        # so it is reopened on the next call
+        packets = _h264_encoder.encode(None)
+        _h264_encoder = None
+    h264_data = b"".join(bytes(packet) for packet in packets)
+    if h264_data:
+        _last_frame_key, _last_h264 = frame_key, h264_data
+    return h264_data
+
+
+def encode_h264_batch(images: Iterable[Image.Image], scale: float = DEFAULT_ENCODE_SCALE) -> list[bytes]:
+    """Encode several frames through the persistent encoder in one call.
+    
+    Every frame is intra-only with no B-frames or lookahead, so each input
+    produces exactly one payload and they come back in input order.
     
-    # Flush encoder
-    for packet in stream.encode():
-        container.mux(packet)
+    Args:
+        images: PIL Images to encode
+        scale: Encode at this fraction of DISPLAY_SIZE (1.0 = native)
+        
+    Returns:
+        list: H.264 payload (Annex B) for each image
+    """
+    return [encode_h264(image, scale) for image in images]
+
+
+def close_encoder() -> None:
+    """Release the persistent H.264 encoder.
     
-    # Close container to finalize output
-    container.close()
+    Safe to call multiple times; the next ``encode_h264()`` call reopens it.
+    """
+    global _h264_encoder, _last_frame_key, _last_h264
     
-    # Get encoded data
-    output_buffer.seek(0)
-    h264_data = output_buffer.read()
+    _last_frame_key, _last_h264 = None, b""
+    if _h264_encoder is None:
+        return
     
-    return h264_data
+    try:
+        # Drain any buffered packets before dropping the context
+        _h264_encoder.encode(None)
+    except Exception:
+        pass
+    _h264_encoder = None
 
 
 def load_background(image_path: str, mode: str = "fill") -> Image.Image | None:
     """Load and resize image to 480x480 based on mode (with caching).
     
+    Large JPEGs are decoded directly at 1/2, 1/4 or 1/8 scale (the largest
+    that still covers the display), which skips most of the IDCT work. The
+    result can differ slightly in exact pixels from a full-size decode
+    followed by a resize.
+    
     Args:
         image_path: Path to image file (PNG, JPG, etc.)
         mode: Scaling mode - "stretch" (distort), "fit" (letterbox), or "fill" (crop)
@@ -118,17 +273,23 @@ def load_background(image_path: str, mode: str = "fill") -> Image.Image | None:
     
     try:
         with Image.open(image_path) as img:
+            lcd_width, lcd_height = DISPLAY_SIZE
+
+            # Let libjpeg decode large JPEGs at a reduced scale (1/2..1/8) that
+            # still covers the display; no-op for other formats
+            img.draft("RGB", (lcd_width, lcd_height))
             img = img.convert("RGB")
 
-            lcd_width, lcd_height = DISPLAY_SIZE
+            # Bilinear is plenty for a 480x480 LCD; Lanczos only on request
+            resample = Image.Resampling.LANCZOS if HIGH_QUALITY_BG else Image.Resampling.BILINEAR
 
             if mode == "stretch":
                 # Stretch to exact size
-                img = img.resize((lcd_width, lcd_height), Image.Resampling.LANCZOS)
+                img = img.resize((lcd_width, lcd_height), resample)
 
             elif mode == "fit":
                 # Fit inside, letterbox with black
-                img.thumbnail((lcd_width, lcd_height), Image.Resampling.LANCZOS)
+                img.thumbnail((lcd_width, lcd_height), resample)
                 new_img = Image.new("RGB", (lcd_width, lcd_height), (0, 0, 0))
                 x = (lcd_width - img.width) // 2
                 y = (lcd_height - img.height) // 2
@@ -137,10 +298,10 @@ def load_background(image_path: str, mode: str = "fill") -> Image.Image | None:
 
             elif mode == "fill":
                 # Crop to fill (may crop edges)
-                img.thumbnail((lcd_width, lcd_height), Image.Resampling.LANCZOS)
+                img.thumbnail((lcd_width, lcd_height), resample)
                 if img.width < lcd_width or img.height < lcd_height:
                     # If smaller, stretch to fill
-                    img = img.resize((lcd_width, lcd_height), Image.Resampling.LANCZOS)
+                    img = img.resize((lcd_width, lcd_height), resample)
                 else:
                     # Crop to exact size
                     left = (img.width - lcd_width) // 2
@@ -159,37 +320,6 @@ def load_background(image_path: str, mode: str = "fill") -> Image.Image | None:
         return None
 
 
-def _find_font(pattern: str) -> str | None:
-    """Find system font using fontconfig (with caching).
-    
-    Args:
-        pattern: fontconfig pattern string (e.g., "NotoSansMono:weight=bold")
-        
-    Returns:
-        str: Path to font file, or None if not found
-    """
-    global _font_cache
-    
-    # Check cache first
-    if pattern in _font_cache:
-        return _font_cache[pattern]
-    
-    # Not in cache, query fontconfig
-    try:
-        result = subprocess.run(
-            ["fc-match", "-f", "%{file}", pattern], capture_output=True, text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            font_path = result.stdout.strip()
-            _font_cache[pattern] = font_path
-            return font_path
-    except Exception:
-        pass
-    
-    _font_cache[pattern] = None
-    return None
-
-
 def _get_system_fonts() -> Dict[str, Any]:
     """Get the best available system fonts for rendering.
     
@@ -197,8 +327,8 @@ def _get_system_fonts() -> Dict[str, Any]:
         dict: Maps font type to file path or None
     """
     # NotoSansMono is best for clock (fixed-width digits don't jump)
-    mono_font = _find_font("NotoSansMono:weight=bold")
-    sans_font = _find_font("NotoSans:weight=bold")
+    mono_font = find_font("NotoSansMono:weight=bold")
+    sans_font = find_font("NotoSans:weight=bold")
 
     font_path = mono_font or sans_font
     
@@ -241,113 +371,273 @@ def _load_fonts(font_path: str | None) -> Dict[str, Any]:
     return fonts
 
 
-def _get_cpu_metrics() -> Tuple[str, str]:
-    """Get CPU temperature and usage (with smoothing).
+def _get_dark_background() -> Image.Image:
+    """Return the dark theme fallback background, rendering it only once.
     
     Returns:
-        tuple: (cpu_temp_str, cpu_percent_str)
+        PIL Image: Shared 480x480 RGB image (callers must not modify it)
     """
-    global _last_cpu_percent
+    global _dark_bg_image
     
-    cpu_temp = "N/A"
-    try:
-        temps = psutil.sensors_temperatures()
-        for sensor_name in TEMP_SENSORS:
-            if sensor_name in temps:
-                cpu_temp = f"{int(temps[sensor_name][0].current)}°C"
-                break
-    except:
-        pass
+    if _dark_bg_image is None:
+        img = Image.new("RGB", DISPLAY_SIZE, color=DEFAULT_DARK_BG)
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([40, 40, 440, 440], fill=DEFAULT_DARK_RECT)
+        _dark_bg_image = img
+    return _dark_bg_image
+
 
-    # Use non-blocking CPU percent with exponential smoothing
-    # interval=None uses cached value, much faster than interval=0
-    current_cpu = psutil.cpu_percent(interval=None)
+@functools.lru_cache(maxsize=512)
+def _text_width(font: Any, text: str) -> int:
+    """Return the rendered width of ``text`` in ``font`` (memoized).
     
-    # Exponential smoothing: smooth_value = 0.7 * old + 0.3 * new
-    if _last_cpu_percent == 0.0:
-        _last_cpu_percent = current_cpu
-    else:
-        _last_cpu_percent = 0.7 * _last_cpu_percent + 0.3 * current_cpu
+    Overlay strings repeat constantly (CPU percentages, clock digits), so
+    their layout is measured once instead of on every frame.
     
-    cpu_percent = f"{int(_last_cpu_percent)}%"
-    return cpu_temp, cpu_percent
+    Args:
+        font: ImageFont used for drawing
+        text: String to measure
+        
+    Returns:
+        int: Width in pixels
+    """
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
 
 
-def create_frame(bg_image: Image.Image | None = None, show_overlay: bool = True, overlay_opacity: int = 180) -> Image.Image:
-    """Create a display frame with optional overlay.
+def _get_static_frame(base: Image.Image, date_text: str, font: Any) -> Image.Image:
+    """Return the background with the date drawn in, re-rendered on change only.
+    
+    The date changes once per day, so it is drawn onto a cached copy of the
+    background instead of being laid out again on every frame.
     
     Args:
-        bg_image: PIL Image to use as background (480x480 RGB)
-        show_overlay: Whether to draw time/date/CPU overlay
-        overlay_opacity: Opacity of overlay background (0-255)
+        base: Background image the overlay is drawn on
+        date_text: Formatted date string
+        font: ImageFont used for the date
         
     Returns:
-        PIL Image: 480x480 RGB image ready for display
+        PIL Image: Shared 480x480 RGB image (callers must copy before drawing)
     """
-    # Start with background or solid dark theme
-    if bg_image:
-        # Only copy if we need to overlay - bg_image is already cached
-        if show_overlay:
-            img = bg_image.copy()
-        else:
-            # No overlay needed, return cached background as-is
-            return bg_image
-    else:
-        # Dark gaming theme fallback
-        img = Image.new("RGB", DISPLAY_SIZE, color=DEFAULT_DARK_BG)
+    global _static_frame, _static_frame_base, _static_frame_date
+    
+    if _static_frame is None or _static_frame_base is not base or _static_frame_date != date_text:
+        # convert() already returns a new image; only copy when it is skipped
+        img = base.copy() if base.mode == "RGB" else base.convert("RGB")
         draw = ImageDraw.Draw(img)
-        draw.rectangle([40, 40, 440, 440], fill=DEFAULT_DARK_RECT)
+        
+        # Date (muted gray)
+        tw = _text_width(font, date_text)
+        draw.text(
+            (240 - tw // 2, TEXT_POSITIONS["date"][1]),
+            date_text,
+            fill=COLOR_GRAY,
+            font=font,
+        )
+        
+        _static_frame = img
+        _static_frame_base = base
+        _static_frame_date = date_text
+    return _static_frame
 
-    if not show_overlay:
-        return img
 
-    # Draw overlay if needed
-    img = img.convert("RGB")
-    draw = ImageDraw.Draw(img)
+def _get_frame_buffer(source: Image.Image) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+    """Fill the reusable frame buffer with ``source`` pixels.
+    
+    The buffer and its ImageDraw context are allocated once and overwritten
+    in place on every frame instead of allocating a new 480x480 image. When
+    ``source`` is the same image as last frame, only the boxes recorded in
+    ``_frame_dirty`` (the previous frame's text) are restored from it rather
+    than copying the whole frame. Callers append every box they draw on.
+    
+    Args:
+        source: 480x480 RGB image to copy into the buffer
+        
+    Returns:
+        tuple: (frame image, draw context bound to it)
+    """
+    global _frame_img, _frame_draw, _frame_source
+    
+    if _frame_img is None or _frame_img.size != source.size:
+        _frame_img = Image.new("RGB", source.size)
+        _frame_draw = ImageDraw.Draw(_frame_img)
+        _frame_source = None
+    
+    if source is _frame_source:
+        for box in _frame_dirty:
+            _frame_img.paste(source.crop(box), box[:2])
+    else:
+        _frame_img.paste(source, (0, 0))
+        _frame_source = source
+    _frame_dirty.clear()
+    return _frame_img, _frame_draw  # type: ignore[return-value]
 
-    # Get system fonts (cached after first call)
-    font_info = _get_system_fonts()
-    fonts = _load_fonts(font_info["path"])
 
+def _get_overlay_fonts() -> Dict[str, Any]:
+    """Return the overlay fonts, resolving and loading them only once.
+    
+    Returns:
+        dict: Maps font name ("time", "cpu", "date") to ImageFont object
+    """
+    global _overlay_fonts
+    
+    if _overlay_fonts is None:
+        font_info = _get_system_fonts()
+        _overlay_fonts = _load_fonts(font_info["path"])
+    return _overlay_fonts
+
+
+def _get_clock_texts() -> Tuple[str, str]:
+    """Get formatted time and date, re-formatting only once per second.
+    
+    ``time.localtime()`` runs once per minute (time zone and DST changes
+    fall on minute boundaries); within a minute only the seconds suffix
+    is swapped in.
+    
+    Returns:
+        tuple: (time_str "HH:MM:SS", date_str "DD.MM.YYYY")
+    """
+    global _last_clock_second, _last_clock_minute, _last_time_prefix
+    global _last_time_text, _last_date_text
+    
+    second = int(time.time())
+    if second != _last_clock_second:
+        minute = second // 60
+        if minute != _last_clock_minute:
+            now = time.localtime(second)
+            _last_time_prefix = f"{now.tm_hour:02d}:{now.tm_min:02d}:"
+            _last_date_text = f"{now.tm_mday:02d}.{now.tm_mon:02d}.{now.tm_year}"
+            _last_clock_minute = minute
+        _last_time_text = _last_time_prefix + _SECOND_TEXTS[second % 60]
+        _last_clock_second = second
+    return _last_time_text, _last_date_text
+
+
+def _get_cpu_metrics() -> Tuple[str, str]:
+    """Get CPU temperature and usage (with smoothing).
+    
+    Returns:
+        tuple: (cpu_temp_str, cpu_percent_str)
+    """
+    global _last_cpu_percent, _last_cpu_ts, _last_temp_ts, _last_temp_str
+    
+    # Re-read temperature sensors at most once per TEMP_REFRESH_INTERVAL_S
+    now = time.monotonic()
+    if _last_temp_ts is None or now - _last_temp_ts >= TEMP_REFRESH_INTERVAL_S:
+        _last_temp_ts = now
+        temp = read_cpu_temp()
+        _last_temp_str = f"{int(temp)}°C" if temp is not None else "N/A"
+    cpu_temp = _last_temp_str
+
+    # Use non-blocking CPU percent with exponential smoothing. interval=None
+    # returns usage since the previous call; never pass a positive interval
+    # here, it would block the render loop for that long on every frame.
+    # Reads are rate-limited: /proc/stat has nothing new between kernel ticks.
+    if _last_cpu_ts is None or now - _last_cpu_ts >= CPU_REFRESH_INTERVAL_S:
+        _last_cpu_ts = now
+        current_cpu = psutil.cpu_percent(interval=None)
+        
+        # Exponential smoothing: smooth_value = 0.7 * old + 0.3 * new
+        if _last_cpu_percent == 0.0:
+            _last_cpu_percent = current_cpu
+        else:
+            _last_cpu_percent = 0.7 * _last_cpu_percent + 0.3 * current_cpu
+    
+    cpu_percent = f"{int(_last_cpu_percent)}%"
+    return cpu_temp, cpu_percent
+
+
+def _render_overlay(base: Image.Image, fonts: Dict[str, Any]) -> Image.Image:
+    """Draw the time/date/CPU overlay over ``base`` into the frame buffer.
+    
+    Args:
+        base: Background image (480x480 RGB)
+        fonts: Overlay fonts from ``_get_overlay_fonts()``
+        
+    Returns:
+        PIL Image: Reused frame buffer holding the finished frame
+    """
     # Get CPU metrics (with smoothing)
     cpu_temp, cpu_percent = _get_cpu_metrics()
 
-    # Get current time/date
-    now = datetime.now()
+    # Get current time/date (formatted once per second)
+    time_text, date_text = _get_clock_texts()
+
+    # Start from the cached background + date layer; only dynamic text is drawn
+    img, draw = _get_frame_buffer(_get_static_frame(base, date_text, fonts["date"]))
 
     # Left - CPU temperature (cyan)
-    draw.text(TEXT_POSITIONS["cpu_temp"], cpu_temp, fill=COLOR_CYAN, font=fonts["cpu"])
+    _frame_dirty.append(
+        draw_text(draw, TEXT_POSITIONS["cpu_temp"], cpu_temp, fill=COLOR_CYAN, font=fonts["cpu"])
+    )
 
     # Right - CPU usage (orange)
-    bbox = draw.textbbox((0, 0), cpu_percent, font=fonts["cpu"])
-    tw = bbox[2] - bbox[0]
-    draw.text(
+    tw = _text_width(fonts["cpu"], cpu_percent)
+    _frame_dirty.append(draw_text(
+        draw,
         (420 - tw, TEXT_POSITIONS["cpu_usage"][1]),
         cpu_percent,
         fill=COLOR_ORANGE,
         font=fonts["cpu"],
-    )
+    ))
 
     # Time (bright cyan/green)
-    time_text = now.strftime("%H:%M:%S")
-    bbox = draw.textbbox((0, 0), time_text, font=fonts["time"])
-    tw = bbox[2] - bbox[0]
-    draw.text(
+    tw = _text_width(fonts["time"], time_text)
+    _frame_dirty.append(draw_text(
+        draw,
         (240 - tw // 2, TEXT_POSITIONS["time"][1]),
         time_text,
         fill=COLOR_BRIGHT_CYAN,
         font=fonts["time"],
-    )
-
-    # Date (muted gray)
-    date_text = now.strftime("%d.%m.%Y")
-    bbox = draw.textbbox((0, 0), date_text, font=fonts["date"])
-    tw = bbox[2] - bbox[0]
-    draw.text(
-        (240 - tw // 2, TEXT_POSITIONS["date"][1]),
-        date_text,
-        fill=COLOR_GRAY,
-        font=fonts["date"],
-    )
+    ))
 
     return img
+
+
+def create_frame(bg_image: Image.Image | None = None, show_overlay: bool = True, overlay_opacity: int = 180) -> Image.Image:
+    """Create a display frame with optional overlay.
+    
+    Args:
+        bg_image: PIL Image to use as background (480x480 RGB)
+        show_overlay: Whether to draw time/date/CPU overlay
+        overlay_opacity: Opacity of overlay background (0-255)
+        
+    Returns:
+        PIL Image: 480x480 RGB image ready for display. With the overlay this
+        is a reused buffer that is overwritten by the next call; without it,
+        the background itself. Callers must not modify it.
+    """
+    # Start with background or the pre-rendered dark gaming theme
+    base = bg_image if bg_image else _get_dark_background()
+
+    if not show_overlay:
+        # No overlay needed, return the cached background as-is
+        return base
+
+    return _render_overlay(base, _get_overlay_fonts())
+
+
+def make_renderer(
+    bg_image: Image.Image | None = None, show_overlay: bool = True, overlay_opacity: int = 180
+) -> Callable[[], Image.Image]:
+    """Build a frame renderer specialized for fixed display settings.
+    
+    Background selection and font loading are resolved once here, so the
+    returned callable only does the per-frame (time/CPU) work. Each call
+    produces the same image ``create_frame()`` would for these arguments.
+    
+    Args:
+        bg_image: PIL Image to use as background (480x480 RGB)
+        show_overlay: Whether to draw time/date/CPU overlay
+        overlay_opacity: Opacity of overlay background (0-255)
+        
+    Returns:
+        Callable: Zero-argument function returning the next frame
+    """
+    base = bg_image if bg_image else _get_dark_background()
+
+    if not show_overlay:
+        return lambda: base
+
+    fonts = _get_overlay_fonts()
+    return lambda: _render_overlay(base, fonts)
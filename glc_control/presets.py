@@ -3,14 +3,45 @@
 import random
 import string
 import math
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, Any, List, Union
+from typing import Dict, Tuple, List, Optional, Union
 from PIL import Image, ImageDraw, ImageFont
 import psutil
-import subprocess
 import os
 
-from .config import DISPLAY_SIZE, TEMP_SENSORS
+from .config import CPU_REFRESH_INTERVAL_S, DISPLAY_SIZE, TEMP_REFRESH_INTERVAL_S
+from .render_utils import draw_text, find_font, read_cpu_temp
+
+# Loaded TrueType fonts keyed by (fontconfig pattern, size); None marks a miss
+_font_cache: Dict[Tuple[str, int], Optional[ImageFont.FreeTypeFont]] = {}
+
+
+def _get_font(pattern: str, size: int) -> Optional[ImageFont.FreeTypeFont]:
+    """Load a TrueType font by fontconfig pattern, caching the result.
+    
+    The pattern is resolved by ``find_font``, which queries libfontconfig
+    in-process through ctypes and caches the path, so repeated lookups cost
+    a dict hit rather than an ``fc-match`` subprocess.
+    
+    Args:
+        pattern: fontconfig pattern (e.g., "NotoSansMono:weight=bold")
+        size: Point size
+        
+    Returns:
+        FreeTypeFont or None if the font could not be found or loaded
+    """
+    key = (pattern, size)
+    if key not in _font_cache:
+        font = None
+        try:
+            font_path = find_font(pattern)
+            if font_path and os.path.exists(font_path):
+                font = ImageFont.truetype(font_path, size)
+        except Exception:
+            pass
+        _font_cache[key] = font
+    return _font_cache[key]
 
 
 class Preset(ABC):
@@ -42,6 +73,11 @@ class MatrixPreset(Preset):
     - Falling letters/numbers animation (bottom-to-top)
     - CPU temperature displayed in center
     - Smooth animation between frames
+    
+    Rendering: each column's whole trail is a cached strip (see
+    ``_get_trail_strip``) pasted once per frame. Columns fall at different
+    speeds, so the frame cannot be produced by scrolling and fading one
+    persistent framebuffer.
     """
     
     def __init__(self, fps: float = 10.0):
@@ -62,29 +98,45 @@ class MatrixPreset(Preset):
         self.col_count = self.width // 10  # ~48 columns for 480px width
         self.cell_height = 15  # Height of each character cell
         
-        # Initialize column states (y position of falling character)
-        self.columns: Dict[int, Dict[str, Any]] = {}
-        for col in range(self.col_count):
-            self.columns[col] = {
-                'y': random.randint(-200, 0),  # Start above screen
-                'char': random.choice(self.char_pool),
-                'speed': random.uniform(1.5, 3.0),  # Pixels per frame
-                'brightness': 255,  # 0-255, fades as it falls
-                'trail_length': random.randint(5, 15),  # Length of fade trail
-            }
+        # Column states, one list per field (indexed by column); discrete
+        # fields are drawn with a single random.choices() call each
+        self.col_y: List[float] = random.choices(range(-200, 1), k=self.col_count)  # Start above screen
+        self.col_char: List[str] = random.choices(self.char_pool, k=self.col_count)
+        self.col_speed: List[float] = [random.uniform(1.5, 3.0) for _ in range(self.col_count)]  # Pixels per frame
+        self.col_trail: List[int] = random.choices(range(5, 16), k=self.col_count)  # Length of fade trail
         
         # Font setup - load once and cache
         self.font = self._load_font()
         self.temp_font = self._load_temp_font()  # Cache temperature font
         
-        # Color palette - shades of green
+        # Pre-rasterized glyph masks for the falling characters
+        self.glyphs = self._build_glyph_cache()
+        
+        # Last temperature reading and its time.monotonic() timestamp; the
+        # sensor only moves on a seconds timescale
+        self._temp_cache: Tuple[Optional[str], float] = (None, 0.0)
+        
+        # Temperature text position and background box, keyed by the text
+        self._temp_layout: Optional[Tuple[str, Tuple[int, int], List[int]]] = None
+        
+        # Whole-trail images per (char, trail_length), built on first use
+        self._trail_strips: Dict[Tuple[str, int], Tuple[Image.Image, Image.Image]] = {}
+        
+        # Color palette - shades of green. Trail shades are pre-dimmed to 70%
+        # so the full-brightness temperature readout stands out on top.
         self.colors = {
-            'bright': (0, 255, 0),      # Bright green - leading edge
-            'mid': (0, 200, 0),         # Mid green
-            'dim': (0, 100, 0),         # Dim green
-            'very_dim': (0, 50, 0),     # Very dim green
+            'bright': (0, 178, 0),      # Bright green - leading edge
+            'mid': (0, 140, 0),         # Mid green
+            'dim': (0, 70, 0),          # Dim green
+            'very_dim': (0, 35, 0),     # Very dim green
+            'text': (0, 255, 0),        # Temperature readout
+            'text_bg': (0, 9, 0),       # Faint box behind the temperature
             'bg': (0, 0, 0),            # Black background
         }
+        
+        # Frame image and its drawing context, reused by every render() call
+        self._img = Image.new("RGB", DISPLAY_SIZE, color=self.colors['bg'])
+        self._draw = ImageDraw.Draw(self._img)
     
     def _load_font(self) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
         """Load or fall back to default font.
@@ -92,22 +144,7 @@ class MatrixPreset(Preset):
         Returns:
             ImageFont: Loaded font or default font
         """
-        try:
-            # Try to find monospace font
-            result = subprocess.run(
-                ["fc-match", "-f", "%{file}", "NotoSansMono"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                font_path = result.stdout.strip()
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, 12)
-        except Exception:
-            pass
-        
-        # Fall back to default font
-        return ImageFont.load_default()
+        return _get_font("NotoSansMono", 12) or ImageFont.load_default()
     
     def _load_temp_font(self) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
         """Load large font for temperature display (cached at init).
@@ -115,35 +152,103 @@ class MatrixPreset(Preset):
         Returns:
             ImageFont: Loaded font or default font
         """
-        try:
-            result = subprocess.run(
-                ["fc-match", "-f", "%{file}", "NotoSansMono:weight=bold"],
-                capture_output=True,
-                text=True,
-            )
-            font_path = result.stdout.strip() if result.returncode == 0 else None
-            if font_path and os.path.exists(font_path):
-                return ImageFont.truetype(font_path, 60)
-        except Exception:
-            pass
-        
         # Fall back to small font
-        return self.font
+        return _get_font("NotoSansMono:weight=bold", 60) or self.font
+    
+    def _build_glyph_cache(self) -> Dict[str, Tuple[Image.Image, int, int]]:
+        """Rasterize every character of the pool once.
+        
+        Trail characters are stamped from these masks with ``draw.bitmap``,
+        which gives the same pixels as ``draw.text`` without running
+        FreeType for every character on every frame.
+        
+        Returns:
+            dict: Character -> (L mask, x offset, y offset)
+        """
+        glyphs = {}
+        for char in self.char_pool:
+            left, top, right, bottom = self.font.getbbox(char)
+            mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+            ImageDraw.Draw(mask).text((-left, -top), char, fill=255, font=self.font)
+            glyphs[char] = (mask, left, top)
+        return glyphs
+    
+    def _get_trail_strip(self, char: str, trail_length: int) -> Tuple[Image.Image, Image.Image]:
+        """Return a column's whole fading trail as one color layer and mask.
+        
+        A trail is the same character repeated every ``cell_height`` pixels
+        with shades set by its position, so it only depends on the character
+        and trail length. Pasting it once replaces one glyph draw per cell.
+        Row 0 of the strip is the top of the dimmest (last) cell.
+        
+        Args:
+            char: Character falling in the column
+            trail_length: Number of cells in the trail
+            
+        Returns:
+            tuple: (RGB color layer, L mask) of the same size
+        """
+        key = (char, trail_length)
+        strip = self._trail_strips.get(key)
+        if strip is None:
+            mask, _, _ = self.glyphs[char]
+            height = (trail_length - 1) * self.cell_height + mask.height
+            colors = Image.new("RGB", (mask.width, height))
+            alpha = Image.new("L", (mask.width, height))
+            colors_draw = ImageDraw.Draw(colors)
+            for i in range(trail_length):
+                top = (trail_length - 1 - i) * self.cell_height
+                color = self._interpolate_color(1.0 - (i / trail_length))
+                colors_draw.rectangle([0, top, mask.width - 1, top + mask.height - 1], fill=color)
+                alpha.paste(mask, (0, top))
+            strip = self._trail_strips[key] = (colors, alpha)
+        return strip
     
     def _get_cpu_temp(self) -> str:
         """Get current CPU temperature.
         
+        The reading is cached for TEMP_REFRESH_INTERVAL_S seconds,
+        independent of the frame rate.
+        
         Returns:
             str: CPU temperature string (e.g., "45°C") or "N/A"
         """
-        try:
-            temps = psutil.sensors_temperatures()
-            for sensor_name in TEMP_SENSORS:
-                if sensor_name in temps:
-                    return f"{int(temps[sensor_name][0].current)}°C"
-        except Exception:
-            pass
-        return "N/A"
+        now = time.monotonic()
+        text, read_at = self._temp_cache
+        if text is not None and now - read_at < TEMP_REFRESH_INTERVAL_S:
+            return text
+        
+        temp = read_cpu_temp()
+        text = f"{int(temp)}°C" if temp is not None else "N/A"
+        self._temp_cache = (text, now)
+        return text
+    
+    def _get_temp_layout(self, draw: ImageDraw.ImageDraw, text: str) -> Tuple[Tuple[int, int], List[int]]:
+        """Get the centered position and background box for the temperature.
+        
+        The layout is only re-measured when the text changes.
+        
+        Args:
+            draw: Drawing context used to measure the text
+            text: Temperature text
+            
+        Returns:
+            tuple: ((x, y) text position, [x0, y0, x1, y1] background box)
+        """
+        if self._temp_layout is None or self._temp_layout[0] != text:
+            bbox = draw.textbbox((0, 0), text, font=self.temp_font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+            padding = 10
+            bg_box = [
+                self.width // 2 - text_width // 2 - padding,
+                self.height // 2 - text_height // 2 - padding,
+                self.width // 2 + text_width // 2 + padding,
+                self.height // 2 + text_height // 2 + padding,
+            ]
+            text_xy = (self.width // 2 - text_width // 2, self.height // 2 - text_height // 2)
+            self._temp_layout = (text, text_xy, bg_box)
+        return self._temp_layout[1], self._temp_layout[2]
     
     def _interpolate_color(self, brightness: float) -> Tuple[int, int, int]:
         """Interpolate color based on brightness/position in trail.
@@ -166,82 +271,58 @@ class MatrixPreset(Preset):
     def render(self) -> Image.Image:
         """Render a frame with falling matrix characters and CPU temp.
         
+        The same image object is redrawn on every call; copy it to keep a
+        frame around.
+        
         Returns:
             PIL Image: 480x480 RGB frame
         """
-        # Create black background
-        img = Image.new("RGB", DISPLAY_SIZE, color=self.colors['bg'])
-        draw = ImageDraw.Draw(img)
+        # Clear to black background
+        img = self._img
+        img.paste(self.colors['bg'], (0, 0, self.width, self.height))
+        draw = self._draw
         
-        # Update and draw columns
+        # Draw the faint background box first; trails fall over it
+        cpu_temp = self._get_cpu_temp()
+        text_xy, bg_box = self._get_temp_layout(draw, cpu_temp)
+        draw.rectangle(bg_box, fill=self.colors['text_bg'])
+        
+        # Update and draw columns; everything the loop touches is bound to
+        # locals so each iteration avoids repeated attribute lookups
+        col_y = self.col_y
+        col_char = self.col_char
+        col_speed = self.col_speed
+        col_trail = self.col_trail
+        glyphs = self.glyphs
+        trail_strips = self._trail_strips
+        paste = img.paste
+        cell_height = self.cell_height
+        height = self.height
+        reset_at = height + 100
         for col_idx in range(self.col_count):
-            col = self.columns[col_idx]
-            
             # Update position
-            col['y'] += col['speed']
+            y = col_y[col_idx] + col_speed[col_idx]
             
             # Reset column if it falls off screen
-            if col['y'] > self.height + 100:
-                col['y'] = -200
-                col['char'] = random.choice(self.char_pool)
-                col['speed'] = random.uniform(1.5, 3.0)
+            if y > reset_at:
+                y = -200
+                col_char[col_idx] = random.choice(self.char_pool)
+                col_speed[col_idx] = random.uniform(1.5, 3.0)
+            col_y[col_idx] = y
             
-            # Draw character trail
-            trail_length = col['trail_length']
-            for i in range(trail_length):
-                y_pos = col['y'] - (i * self.cell_height)
-                
-                # Only draw if visible on screen
-                if -20 < y_pos < self.height + 20:
-                    # Calculate brightness for this trail segment
-                    brightness = 1.0 - (i / trail_length)
-                    color = self._interpolate_color(brightness)
-                    
-                    # Draw character
-                    x_pos = col_idx * 10 + 2
-                    try:
-                        draw.text(
-                            (x_pos, int(y_pos)),
-                            col['char'],
-                            fill=color,
-                            font=self.font,
-                        )
-                    except Exception:
-                        pass
-        
-        # Draw CPU temperature in center (using cached font)
-        cpu_temp = self._get_cpu_temp()
-        
-        # Get text bounding box for centering
-        bbox = draw.textbbox((0, 0), cpu_temp, font=self.temp_font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        # Draw semi-transparent background for temperature
-        padding = 10
-        bg_box = [
-            self.width // 2 - text_width // 2 - padding,
-            self.height // 2 - text_height // 2 - padding,
-            self.width // 2 + text_width // 2 + padding,
-            self.height // 2 + text_height // 2 + padding,
-        ]
-        
-        # Create overlay for background box
-        overlay = Image.new("RGB", DISPLAY_SIZE, color=self.colors['bg'])
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rectangle(bg_box, fill=(0, 30, 0))
-        
-        # Blend overlay with main image
-        img = Image.blend(img, overlay, 0.3)
-        draw = ImageDraw.Draw(img)
-        
-        # Draw temperature text in bright green
-        draw.text(
-            (self.width // 2 - text_width // 2, self.height // 2 - text_height // 2),
-            cpu_temp,
-            fill=self.colors['bright'],
-            font=self.temp_font,
-        )
+            # Paste the whole trail at once; its head cell sits at y
+            trail_length = col_trail[col_idx]
+            top = int(y) - (trail_length - 1) * cell_height
+            if top < height and y > -cell_height:
+                char = col_char[col_idx]
+                colors, alpha = trail_strips.get((char, trail_length)) or self._get_trail_strip(char, trail_length)
+                _, dx, dy = glyphs[char]
+                x, y0 = col_idx * 10 + 2 + dx, top + dy
+                paste(colors, (x, y0), alpha)
+        
+        # Draw temperature text in bright green; the text is rasterized once
+        # per distinct reading and stamped from the cached mask
+        draw_text(draw, text_xy, cpu_temp, self.colors['text'], self.temp_font)
         
         self.frame_count += 1
         return img
@@ -277,17 +358,41 @@ class HeartbeatPreset(Preset):
         # Number of bar segments (symmetric from center)
         self.segment_count = 16  # 16 segments total (8 on each side)
         
+        # Per-segment wave phase offsets and center boosts (constant per index)
+        half_segments = self.segment_count // 2
+        self._wave_offsets = [i * 0.4 for i in range(half_segments)]
+        self._center_boosts = [1.0 - (i / half_segments) * 0.4 for i in range(half_segments)]
+        
         # Font setup
         self.bar_font = self._load_bar_font()
         self.cpu_font = self._load_cpu_font()
+        self.label_font = _get_font("NotoSansMono", 20) or self.cpu_font
         
         # Color definitions
         self.bg_color = (0, 0, 0)  # Black background
         
+        # Frame image and its drawing context, reused by every render() call
+        self._img = Image.new("RGB", DISPLAY_SIZE, color=self.bg_color)
+        self._draw = ImageDraw.Draw(self._img)
+        
+        # Text sizes measured once: the label is fixed, CPU text by string,
+        # and the bar by its tallest block (lower-block glyphs share a bottom
+        # edge and the brackets fix the left and right edges)
+        self.label_text = "CPU LOAD"
+        label_bbox = self._draw.textbbox((0, 0), self.label_text, font=self.label_font)
+        self._label_width = label_bbox[2] - label_bbox[0]
+        self._cpu_text_sizes: Dict[str, Tuple[int, int]] = {}
+        self._bar_sizes: Dict[str, Tuple[int, int]] = {}
+        
         # CPU load tracking (smoothed)
         self.cpu_history: List[float] = []
         self.cpu_history_size = 5
         self.current_cpu = 0.0
+        
+        # Monotonic time of the last psutil sample; cpu_percent(interval=0)
+        # reports the delta since the previous call, and /proc/stat has
+        # nothing new between kernel ticks
+        self._cpu_read_ts: Optional[float] = None
     
     def _load_bar_font(self) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
         """Load large monospace font for bar characters.
@@ -295,20 +400,7 @@ class HeartbeatPreset(Preset):
         Returns:
             ImageFont: Loaded font or default font
         """
-        try:
-            result = subprocess.run(
-                ["fc-match", "-f", "%{file}", "NotoSansMono"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                font_path = result.stdout.strip()
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, 80)
-        except Exception:
-            pass
-        
-        return ImageFont.load_default()
+        return _get_font("NotoSansMono", 80) or ImageFont.load_default()
     
     def _load_cpu_font(self) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
         """Load font for CPU percentage display.
@@ -316,27 +408,23 @@ class HeartbeatPreset(Preset):
         Returns:
             ImageFont: Loaded font or default font
         """
-        try:
-            result = subprocess.run(
-                ["fc-match", "-f", "%{file}", "NotoSansMono:weight=bold"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                font_path = result.stdout.strip()
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, 48)
-        except Exception:
-            pass
-        
-        return ImageFont.load_default()
+        return _get_font("NotoSansMono:weight=bold", 48) or ImageFont.load_default()
     
     def _get_cpu_load(self) -> float:
         """Get current CPU load percentage (smoothed).
         
+        psutil is sampled at most every CPU_REFRESH_INTERVAL_S seconds,
+        whatever the frame rate; in between the last smoothed value is
+        returned.
+        
         Returns:
             float: CPU load 0-100
         """
+        now = time.monotonic()
+        if self._cpu_read_ts is not None and now - self._cpu_read_ts < CPU_REFRESH_INTERVAL_S:
+            return self.current_cpu
+        self._cpu_read_ts = now
+        
         try:
             # Non-blocking CPU percent reading
             cpu = psutil.cpu_percent(interval=0)
@@ -385,17 +473,17 @@ class HeartbeatPreset(Preset):
             b = 0
             return (r, g, b)
     
-    def _calculate_pulse_intensity(self, segment_idx: int, cpu_load: float) -> float:
-        """Calculate pulse intensity for a given segment.
+    def _calculate_pulse_intensities(self, cpu_load: float) -> List[float]:
+        """Calculate pulse intensity for every segment of one half of the bar.
         
-        Creates a pulsing wave effect that emanates from center.
+        Creates a pulsing wave effect that emanates from center. The values
+        that only depend on the frame are computed once for all segments.
         
         Args:
-            segment_idx: Segment index (0 = center, higher = edge)
             cpu_load: Current CPU load 0-100
             
         Returns:
-            float: Intensity 0-1 for this segment
+            list: Intensity 0-1 per segment (index 0 = center, higher = edge)
         """
         # Base intensity from CPU load (boosted so 80%+ CPU can reach full █)
         base_intensity = min(1.2, cpu_load / 80.0)  # Over 1.0 to compensate for wave/center factors
@@ -404,26 +492,52 @@ class HeartbeatPreset(Preset):
         pulse_speed = 2.0 + (cpu_load / 100.0) * 4.0  # Faster pulse with higher load
         pulse_phase = (self.frame_count / self.fps) * pulse_speed
         
-        # Wave propagates OUTWARD from center (positive offset for outward motion)
-        wave_offset = segment_idx * 0.4
-        pulse_wave = (math.sin(pulse_phase + wave_offset) + 1.0) / 2.0  # 0-1 range
-        
-        # Center segments are STRONGER (heartbeat emanates from center)
-        # Closer to center = taller bars
-        center_boost = 1.0 - (segment_idx / (self.segment_count / 2)) * 0.4
+        sin = math.sin
+        return [
+            # Wave propagates OUTWARD from center (positive offset for outward
+            # motion); center segments are boosted so the heartbeat emanates
+            # from the middle
+            max(0.0, min(1.0, base_intensity * ((sin(pulse_phase + wave_offset) + 1.0) / 2.0) * center_boost))
+            for wave_offset, center_boost in zip(self._wave_offsets, self._center_boosts)
+        ]
+    
+    def _text_size(
+        self,
+        cache: Dict[str, Tuple[int, int]],
+        key: str,
+        text: str,
+        font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont],
+    ) -> Tuple[int, int]:
+        """Measure text once per cache key.
         
-        intensity = base_intensity * pulse_wave * center_boost
-        return max(0.0, min(1.0, intensity))
+        Args:
+            cache: Dict holding sizes already measured
+            key: Cache key; texts sharing a key must share a size
+            text: Text to measure on a miss
+            font: Font used to draw the text
+            
+        Returns:
+            tuple: (width, height) in pixels
+        """
+        size = cache.get(key)
+        if size is None:
+            bbox = self._draw.textbbox((0, 0), text, font=font)
+            size = cache[key] = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        return size
     
     def render(self) -> Image.Image:
         """Render a frame with pulsing heartbeat CPU visualization.
         
+        The same image object is redrawn on every call; copy it to keep a
+        frame around.
+        
         Returns:
             PIL Image: 480x480 RGB frame
         """
-        # Create black background
-        img = Image.new("RGB", DISPLAY_SIZE, color=self.bg_color)
-        draw = ImageDraw.Draw(img)
+        # Clear to black background
+        img = self._img
+        img.paste(self.bg_color, (0, 0, self.width, self.height))
+        draw = self._draw
         
         # Get current CPU load
         cpu_load = self._get_cpu_load()
@@ -432,34 +546,22 @@ class HeartbeatPreset(Preset):
         # Get color for current load
         bar_color = self._get_color_for_load(cpu_load)
         
-        # Calculate bar layout
-        # Draw segments from center outward (symmetric)
-        half_segments = self.segment_count // 2
-        
-        # Build bar string with block characters
-        bar_chars = []
-        bar_chars.append('|')  # Left bracket
-        
-        # Left side (reverse order - tallest in center)
-        for i in range(half_segments - 1, -1, -1):
-            intensity = self._calculate_pulse_intensity(i, cpu_load)
-            block_idx = int(intensity * (len(self.blocks) - 1))
-            bar_chars.append(self.blocks[block_idx])
-        
-        # Right side (mirror of left)
-        for i in range(half_segments):
-            intensity = self._calculate_pulse_intensity(i, cpu_load)
-            block_idx = int(intensity * (len(self.blocks) - 1))
-            bar_chars.append(self.blocks[block_idx])
+        # Block characters from the center outward; both sides are mirrors,
+        # so each segment's intensity is computed once
+        max_block = len(self.blocks) - 1
+        blocks = self.blocks
+        right = ''.join(
+            blocks[int(intensity * max_block)]
+            for intensity in self._calculate_pulse_intensities(cpu_load)
+        )
         
-        bar_chars.append('|')  # Right bracket
-        bar_string = ''.join(bar_chars)
+        # Left side is reversed (tallest in center), wrapped in brackets
+        bar_string = '|' + right[::-1] + right + '|'
         
         # Draw the bar
-        # Center it horizontally
-        bbox = draw.textbbox((0, 0), bar_string, font=self.bar_font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        # Center it horizontally; ▁..█ are consecutive code points, so max()
+        # picks the tallest block
+        text_width, text_height = self._text_size(self._bar_sizes, max(right), bar_string, self.bar_font)
         
         bar_x = (self.width - text_width) // 2
         bar_y = (self.height - text_height) // 2 + 40  # Slightly below center
@@ -473,9 +575,7 @@ class HeartbeatPreset(Preset):
         
         # Draw CPU percentage in center (above bar)
         cpu_text = f"{int(cpu_load)}%"
-        cpu_bbox = draw.textbbox((0, 0), cpu_text, font=self.cpu_font)
-        cpu_width = cpu_bbox[2] - cpu_bbox[0]
-        cpu_height = cpu_bbox[3] - cpu_bbox[1]
+        cpu_width, cpu_height = self._text_size(self._cpu_text_sizes, cpu_text, cpu_text, self.cpu_font)
         
         cpu_x = (self.width - cpu_width) // 2
         cpu_y = (self.height - cpu_height) // 2 - 80  # Above bar
@@ -501,26 +601,10 @@ class HeartbeatPreset(Preset):
         )
         
         # Draw label
-        label_text = "CPU LOAD"
-        label_font = self._load_cpu_font()  # Reuse same font
-        
-        # Make label smaller by trying a smaller size
-        try:
-            result = subprocess.run(
-                ["fc-match", "-f", "%{file}", "NotoSansMono"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                font_path = result.stdout.strip()
-                if os.path.exists(font_path):
-                    label_font = ImageFont.truetype(font_path, 20)
-        except Exception:
-            pass
+        label_text = self.label_text
+        label_font = self.label_font
         
-        label_bbox = draw.textbbox((0, 0), label_text, font=label_font)
-        label_width = label_bbox[2] - label_bbox[0]
-        label_x = (self.width - label_width) // 2
+        label_x = (self.width - self._label_width) // 2
         label_y = cpu_y - 40
         
         # Draw label with dimmer color
@@ -0,0 +1,257 @@
+"""Font lookup, text stamping and CPU temperature helpers.
+
+Shared by the overlay renderer in ``image_processor`` and the presets, so
+that neither reaches into the other's internals and presets can be used
+without loading the H.264 encoder.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import ctypes
+import ctypes.util
+import functools
+import os
+import subprocess
+from PIL import Image, ImageDraw
+import psutil
+
+from .config import HWMON_PATH, TEMP_SENSORS
+
+# Resolved font paths keyed by fontconfig pattern (None marks a miss)
+_font_cache: Dict[str, Optional[str]] = {}
+
+# In-process fontconfig handle: (library, FcConfig*), None if unavailable
+_fontconfig: Optional[Tuple[Any, int]] = None
+_fontconfig_loaded: bool = False
+
+# sysfs temperature input of the first TEMP_SENSORS hwmon device, found once
+_temp_input_path: Optional[str] = None
+_temp_input_searched: bool = False
+
+
+def _load_fontconfig() -> Optional[Tuple[Any, int]]:
+    """Load libfontconfig and its font configuration once per process.
+    
+    Returns:
+        tuple: (ctypes library, FcConfig pointer), or None if fontconfig
+        cannot be loaded (callers then fall back to the fc-match binary)
+    """
+    global _fontconfig, _fontconfig_loaded
+    
+    if _fontconfig_loaded:
+        return _fontconfig
+    _fontconfig_loaded = True
+    
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library("fontconfig") or "libfontconfig.so.1")
+        lib.FcInitLoadConfigAndFonts.restype = ctypes.c_void_p
+        lib.FcNameParse.restype = ctypes.c_void_p
+        lib.FcNameParse.argtypes = [ctypes.c_char_p]
+        lib.FcConfigSubstitute.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+        lib.FcDefaultSubstitute.argtypes = [ctypes.c_void_p]
+        lib.FcFontMatch.restype = ctypes.c_void_p
+        lib.FcFontMatch.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+        lib.FcPatternGetString.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p)
+        ]
+        lib.FcPatternDestroy.argtypes = [ctypes.c_void_p]
+        
+        config = lib.FcInitLoadConfigAndFonts()
+        if config:
+            _fontconfig = (lib, config)
+    except (OSError, AttributeError):
+        # Library missing or too old; fc-match subprocess is used instead
+        _fontconfig = None
+    return _fontconfig
+
+
+def _fontconfig_match(fontconfig: Tuple[Any, int], pattern: str) -> str | None:
+    """Resolve a font pattern to a file path, like ``fc-match -f %{file}``.
+    
+    Args:
+        fontconfig: Handle returned by ``_load_fontconfig()``
+        pattern: fontconfig pattern string (e.g., "NotoSansMono:weight=bold")
+        
+    Returns:
+        str: Path to font file, or None if nothing matched
+    """
+    lib, config = fontconfig
+    
+    pat = lib.FcNameParse(pattern.encode())
+    if not pat:
+        return None
+    try:
+        # Same substitution + match sequence fc-match runs internally
+        lib.FcConfigSubstitute(config, pat, 0)  # FcMatchPattern
+        lib.FcDefaultSubstitute(pat)
+        result = ctypes.c_int()
+        match = lib.FcFontMatch(config, pat, ctypes.byref(result))
+        if not match:
+            return None
+        try:
+            file_name = ctypes.c_char_p()
+            if lib.FcPatternGetString(match, b"file", 0, ctypes.byref(file_name)) != 0:
+                return None
+            return file_name.value.decode() if file_name.value else None
+        finally:
+            lib.FcPatternDestroy(match)
+    finally:
+        lib.FcPatternDestroy(pat)
+
+
+def find_font(pattern: str) -> str | None:
+    """Find system font using fontconfig (with caching).
+    
+    Fonts are resolved in-process through libfontconfig; the ``fc-match``
+    binary is only spawned when the library cannot be loaded.
+    
+    Args:
+        pattern: fontconfig pattern string (e.g., "NotoSansMono:weight=bold")
+        
+    Returns:
+        str: Path to font file, or None if not found
+    """
+    global _font_cache
+    
+    # Check cache first
+    if pattern in _font_cache:
+        return _font_cache[pattern]
+    
+    font_path = None
+    try:
+        fontconfig = _load_fontconfig()
+        if fontconfig is not None:
+            font_path = _fontconfig_match(fontconfig, pattern)
+        else:
+            result = subprocess.run(
+                ["fc-match", "-f", "%{file}", pattern], capture_output=True, text=True
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                font_path = result.stdout.strip()
+    except Exception:
+        pass
+    
+    _font_cache[pattern] = font_path
+    return font_path
+
+
+@functools.lru_cache(maxsize=256)
+def _text_mask(font: Any, text: str) -> Tuple[Image.Image, int, int]:
+    """Rasterize ``text`` once into a grayscale coverage mask (memoized).
+    
+    The overlay's dynamic strings repeat for many frames (the clock for a
+    whole second, CPU readings far longer), so each is rendered by FreeType
+    once and then stamped with ``draw_text``.
+    
+    Args:
+        font: ImageFont used for drawing
+        text: String to rasterize
+        
+    Returns:
+        tuple: (L mask, x offset, y offset) relative to the draw position
+    """
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return mask, left, top
+
+
+def draw_text(
+    draw: ImageDraw.ImageDraw, xy: Tuple[int, int], text: str, fill: Tuple[int, int, int], font: Any
+) -> Tuple[int, int, int, int]:
+    """Draw text like ``draw.text`` using the cached mask from ``_text_mask``.
+    
+    Args:
+        draw: ImageDraw context of the target image
+        xy: Integer (x, y) position, as passed to ``draw.text``
+        text: String to draw
+        fill: RGB text color
+        font: ImageFont used for drawing
+        
+    Returns:
+        tuple: Box (left, top, right, bottom) of the pixels that were touched
+    """
+    mask, dx, dy = _text_mask(font, text)
+    x, y = xy[0] + dx, xy[1] + dy
+    # Glyphs live only in the 1 byte/pixel mask; the color is applied while
+    # blending into the RGB frame, so no per-color or palette layer exists
+    draw.bitmap((x, y), mask, fill=fill)
+    return x, y, x + mask.width, y + mask.height
+
+
+def _find_temp_input() -> str | None:
+    """Locate the sysfs temperature file of the CPU sensor (searched once).
+    
+    Walks HWMON_PATH a single time and picks the first hwmon device whose
+    name is listed in TEMP_SENSORS (in priority order), using its lowest
+    numbered ``temp*_input`` -- the same reading psutil reports first.
+    
+    Returns:
+        str: Path to the ``temp*_input`` file, or None if no sensor matched
+    """
+    global _temp_input_path, _temp_input_searched
+    
+    if _temp_input_searched:
+        return _temp_input_path
+    _temp_input_searched = True
+    
+    devices: Dict[str, str] = {}
+    try:
+        # hwmon2 before hwmon10: order by device number, not by string
+        entries = sorted(
+            os.listdir(HWMON_PATH),
+            key=lambda e: int(e[5:]) if e.startswith("hwmon") and e[5:].isdigit() else 1 << 30,
+        )
+        for entry in entries:
+            device = os.path.join(HWMON_PATH, entry)
+            try:
+                with open(os.path.join(device, "name")) as f:
+                    devices.setdefault(f.read().strip(), device)
+            except OSError:
+                continue
+    except OSError:
+        return None
+    
+    for sensor_name in TEMP_SENSORS:
+        device = devices.get(sensor_name)
+        if device is None:
+            continue
+        try:
+            inputs = [
+                name for name in os.listdir(device)
+                if name.startswith("temp") and name.endswith("_input") and name[4:-6].isdigit()
+            ]
+        except OSError:
+            continue
+        if inputs:
+            inputs.sort(key=lambda name: int(name[4:-6]))
+            _temp_input_path = os.path.join(device, inputs[0])
+            break
+    return _temp_input_path
+
+
+def read_cpu_temp() -> float | None:
+    """Read the current CPU temperature in degrees Celsius.
+    
+    Reads the sysfs file found by ``_find_temp_input()`` directly; only when
+    no such file exists does it fall back to ``psutil.sensors_temperatures()``,
+    which rescans every hwmon device on each call.
+    
+    Returns:
+        float: Temperature in °C, or None if no sensor is available
+    """
+    path = _find_temp_input()
+    if path is not None:
+        try:
+            with open(path) as f:
+                return int(f.read()) / 1000.0  # millidegrees
+        except (OSError, ValueError):
+            pass
+    
+    try:
+        temps = psutil.sensors_temperatures()
+        for sensor_name in TEMP_SENSORS:
+            if sensor_name in temps:
+                return temps[sensor_name][0].current
+    except Exception:
+        pass
+    return None
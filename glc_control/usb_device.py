@@ -1,6 +1,7 @@
 """USB communication for Lian Li Galahad II LCD control."""
 
 from typing import Tuple, Any
+import struct
 import usb.core
 import usb.util
 import time
@@ -14,6 +15,18 @@ from .config import (
     VideoPacket,
 )
 
+# Video packet header: magic bytes + total frame size, then seq (24-bit) + chunk size
+_VIDEO_FRAME_HEADER = struct.Struct(">BBI")
+_VIDEO_CHUNK_HEADER = struct.Struct(">BHH")
+
+# RGB pump packet with everything but the color filled in
+_RGB_PACKET_TEMPLATE = bytearray(RGBPacket.SIZE)
+_RGB_PACKET_TEMPLATE[0] = RGBPacket.HEADER_BYTE  # 0x01
+_RGB_PACKET_TEMPLATE[1] = RGBPacket.COLOR_CMD    # 0x83
+_RGB_PACKET_TEMPLATE[RGBPacket.COLOR_OFFSET] = RGBPacket.PAYLOAD_SIZE  # packet[5] = 19
+# RGB payload header (required by device protocol before the RGB values)
+_RGB_PACKET_TEMPLATE[6:10] = b"\x00\x03\x04\x00"
+
 
 def send_h264_frame(endpoint: usb.core.Endpoint, h264_data: bytes) -> None:
     """Send H.264 frame data to USB device in chunked packets.
@@ -26,36 +39,53 @@ def send_h264_frame(endpoint: usb.core.Endpoint, h264_data: bytes) -> None:
     - Payload (up to 1013 bytes)
     - Padding to 1024 bytes total
     
+    At least ``SLEEP_BETWEEN_PACKETS_S`` passes between one write returning
+    and the next write starting, however long the write itself took; no
+    delay follows the last packet.
+    
     Args:
         endpoint: USB endpoint to write to
         h264_data: bytes of H.264 encoded video data
     """
+    total_len = len(h264_data)
+    payload_size = USBProtocol.CHUNK_SIZE
+    data = memoryview(h264_data)
+
+    # One packet buffer per frame; the frame header is identical for every chunk
+    packet = bytearray(USBProtocol.MAX_PACKET_SIZE)
+    _VIDEO_FRAME_HEADER.pack_into(
+        packet,
+        VideoPacket.HEADER_1,
+        USBProtocol.HEADER_BYTE_1,
+        USBProtocol.HEADER_BYTE_2,
+        total_len,
+    )
+
     offset = 0
     seq = 0
-
-    while offset < len(h264_data):
-        chunk_len = min(USBProtocol.CHUNK_SIZE, len(h264_data) - offset)
-        chunk = h264_data[offset : offset + chunk_len]
-
-        packet = bytearray(USBProtocol.MAX_PACKET_SIZE)
-        packet[VideoPacket.HEADER_1] = USBProtocol.HEADER_BYTE_1
-        packet[VideoPacket.HEADER_2] = USBProtocol.HEADER_BYTE_2
-        packet[VideoPacket.DATA_LEN_B3] = (len(h264_data) >> 24) & 0xFF
-        packet[VideoPacket.DATA_LEN_B2] = (len(h264_data) >> 16) & 0xFF
-        packet[VideoPacket.DATA_LEN_B1] = (len(h264_data) >> 8) & 0xFF
-        packet[VideoPacket.DATA_LEN_B0] = len(h264_data) & 0xFF
-        packet[VideoPacket.SEQ_B2] = (seq >> 16) & 0xFF
-        packet[VideoPacket.SEQ_B1] = (seq >> 8) & 0xFF
-        packet[VideoPacket.SEQ_B0] = seq & 0xFF
-        packet[VideoPacket.CHUNK_LEN_B1] = (chunk_len >> 8) & 0xFF
-        packet[VideoPacket.CHUNK_LEN_B0] = chunk_len & 0xFF
-        packet[VideoPacket.PAYLOAD : VideoPacket.PAYLOAD + chunk_len] = chunk
-
+    next_write = 0.0
+
+    while offset < total_len:
+        chunk_len = min(payload_size, total_len - offset)
+
+        _VIDEO_CHUNK_HEADER.pack_into(
+            packet, VideoPacket.SEQ_B2, (seq >> 16) & 0xFF, seq & 0xFFFF, chunk_len
+        )
+        packet[VideoPacket.PAYLOAD : VideoPacket.PAYLOAD + chunk_len] = data[offset : offset + chunk_len]
+        if chunk_len < payload_size:
+            # Short (last) chunk: zero the padding left over from the previous chunk
+            packet[VideoPacket.PAYLOAD + chunk_len :] = bytes(payload_size - chunk_len)
+
+        now = time.monotonic()
+        if now < next_write:
+            time.sleep(next_write - now)
         endpoint.write(bytes(packet), timeout=USBProtocol.TIMEOUT_MS)
+        # The gap is measured from when the write returned, so the device
+        # always gets the full idle time; packing the next chunk counts toward it
+        next_write = time.monotonic() + USBProtocol.SLEEP_BETWEEN_PACKETS_S
 
         offset += chunk_len
         seq += 1
-        time.sleep(USBProtocol.SLEEP_BETWEEN_PACKETS_S)
 
 
 def find_device() -> Any:
@@ -122,24 +152,13 @@ def set_rgb_color(endpoint: Any, rgb_color: Tuple[int, int, int]) -> None:
         endpoint: USB endpoint to write to
         rgb_color: tuple of (R, G, B) values 0-255
     """
-    packet = bytearray(RGBPacket.SIZE)
-    packet[0] = RGBPacket.HEADER_BYTE  # 0x01
-    packet[1] = RGBPacket.COLOR_CMD    # 0x83
-    packet[RGBPacket.COLOR_OFFSET] = RGBPacket.PAYLOAD_SIZE  # packet[5] = 19
-    
-    # Set the RGB payload header (required by device protocol)
-    # This header must be present before RGB values
-    packet[6] = 0x00
-    packet[7] = 0x03
-    packet[8] = 0x04
-    packet[9] = 0x00
+    packet = bytearray(_RGB_PACKET_TEMPLATE)
     
-    # Set RGB values after the header
+    # Set RGB values after the header; rest of payload is zeros
     packet[10] = rgb_color[0]  # Red
     packet[11] = rgb_color[1]  # Green
     packet[12] = rgb_color[2]  # Blue
     
-    # Rest of payload is zeros (already initialized)
     endpoint.write(bytes(packet), timeout=1000)
 
 
@@ -6,6 +6,7 @@ import os
 from unittest.mock import Mock, MagicMock, patch
 from PIL import Image
 import tempfile
+import usb.core
 
 # Add parent directory to path so we can import glc_control
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,6 +27,31 @@ def temp_image():
         pass
 
 
+@pytest.fixture(scope="session")
+def temp_image_loaded(tmp_path_factory):
+    """Decoded copy of the ``temp_image`` PNG, shared by the whole session.
+    
+    For tests that only need the pixels, not the file; they must not modify it.
+    """
+    path = tmp_path_factory.mktemp("images") / "temp_image.png"
+    Image.new("RGB", (100, 100), color=(255, 0, 0)).save(path)
+    with Image.open(path) as img:
+        return img.copy()
+
+
+@pytest.fixture(scope="session")
+def temp_background(temp_image_loaded, tmp_path_factory):
+    """``load_background()`` result for the ``temp_image`` PNG, loaded once.
+    
+    Tests must not modify it.
+    """
+    from glc_control.image_processor import load_background
+
+    path = tmp_path_factory.mktemp("backgrounds") / "temp_image.png"
+    temp_image_loaded.save(path)
+    return load_background(str(path))
+
+
 @pytest.fixture
 def temp_large_image():
     """Create a larger temporary test image."""
@@ -56,8 +82,8 @@ def temp_small_image():
 
 @pytest.fixture
 def mock_usb_endpoint():
-    """Create a mock USB endpoint."""
-    endpoint = Mock()
+    """Create a mock USB endpoint limited to the pyusb Endpoint interface."""
+    endpoint = Mock(spec=usb.core.Endpoint)
     endpoint.write = Mock(return_value=1024)
     return endpoint
 
@@ -83,8 +109,9 @@ def sample_h264_data():
 @pytest.fixture(autouse=True)
 def mock_psutil():
     """Mock psutil to avoid hardware dependency."""
-    with patch("glc_control.image_processor.psutil.sensors_temperatures") as mock_temps, \
-         patch("glc_control.image_processor.psutil.cpu_percent") as mock_cpu:
+    with patch("glc_control.render_utils.psutil.sensors_temperatures") as mock_temps, \
+         patch("glc_control.image_processor.psutil.cpu_percent") as mock_cpu, \
+         patch("glc_control.render_utils._find_temp_input", return_value=None):
         mock_temps.return_value = {
             "coretemp": [Mock(current=45.0)],
         }
@@ -95,7 +122,7 @@ def mock_psutil():
 @pytest.fixture(autouse=True)
 def mock_subprocess():
     """Mock subprocess for ffmpeg calls."""
-    with patch("glc_control.image_processor.subprocess.run") as mock_run:
+    with patch("glc_control.render_utils.subprocess.run") as mock_run:
         # Create a fake H.264 output file for testing
         def run_side_effect(cmd, **kwargs):
             if "ffmpeg" in cmd:
@@ -114,8 +141,9 @@ def mock_subprocess():
 @pytest.fixture(autouse=True)
 def mock_fontconfig():
     """Mock fontconfig and os.path.exists to avoid font dependency."""
-    with patch("glc_control.image_processor.subprocess.run") as mock_run, \
-         patch("glc_control.image_processor.os.path.exists") as mock_exists:
+    with patch("glc_control.render_utils.subprocess.run") as mock_run, \
+         patch("glc_control.image_processor.os.path.exists") as mock_exists, \
+         patch("glc_control.render_utils._load_fontconfig", return_value=None):
         
         def run_side_effect(cmd, **kwargs):
             if "fc-match" in cmd:
@@ -0,0 +1,94 @@
+"""Tests for config file discovery and loading."""
+
+import os
+import pathlib
+import pytest
+from glc_control import config_loader
+from glc_control.config_loader import find_config_file, load_config
+
+
+@pytest.fixture(autouse=True)
+def real_path_exists(monkeypatch):
+    """Undo the font fixture's os.path.exists mock for real file lookups."""
+    monkeypatch.setattr(os.path, "exists", lambda p: pathlib.Path(p).exists())
+
+
+@pytest.fixture
+def config_paths(tmp_path, monkeypatch):
+    """Point config discovery at a temporary directory with an empty cache."""
+    path = tmp_path / "gaii-control.toml"
+    monkeypatch.setattr(config_loader, "DEFAULT_CONFIG_PATHS", [str(path)])
+    monkeypatch.setattr(config_loader, "_found_config", config_loader._UNSET)
+    return path
+
+
+class TestFindConfigFile:
+    """Test config file discovery."""
+
+    def test_no_config_file(self, config_paths):
+        """Test that None is returned when no config exists."""
+        assert find_config_file() is None
+
+    def test_finds_existing_config(self, config_paths):
+        """Test that an existing config file is found."""
+        config_paths.write_text("fps = 10.0\n")
+        assert find_config_file() == str(config_paths)
+
+    def test_result_is_cached(self, config_paths):
+        """Test that the lookup is cached until refresh is requested."""
+        assert find_config_file() is None
+        config_paths.write_text("fps = 10.0\n")
+        assert find_config_file() is None
+        assert find_config_file(refresh=True) == str(config_paths)
+
+    def test_expands_home_directory(self, tmp_path, monkeypatch):
+        """Test that ~ in default paths is expanded on lookup."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(config_loader, "DEFAULT_CONFIG_PATHS", ["~/gaii-control.toml"])
+        monkeypatch.setattr(config_loader, "_found_config", config_loader._UNSET)
+        (tmp_path / "gaii-control.toml").write_text("fps = 10.0\n")
+        assert find_config_file() == str(tmp_path / "gaii-control.toml")
+
+
+class TestLoadConfig:
+    """Test TOML config loading."""
+
+    def test_load_section(self, config_paths):
+        """Test that the [gaii-control] section is extracted."""
+        config_paths.write_text('[gaii-control]\nfps = 10.0\nrgb = "#FF0000"\n')
+        assert load_config(str(config_paths)) == {"fps": 10.0, "rgb": "#FF0000"}
+
+    def test_load_missing_file(self, tmp_path):
+        """Test that a missing file yields an empty config."""
+        assert load_config(str(tmp_path / "missing.toml")) == {}
+
+
+class TestParseArgsConfig:
+    """Test config file values merged by parse_args."""
+
+    @pytest.mark.parametrize("value,expected,warning", [
+        ("5.0", 1.0, "out of range"),
+        ("0.01", 0.1, "out of range"),
+        ('"0.5"', 0.5, None),
+        ('"half"', 1.0, "Invalid encode_scale"),
+    ])
+    def test_encode_scale_from_config_is_validated(self, config_paths, capsys, value, expected, warning):
+        """Test that encode_scale from the config file is converted and clamped."""
+        from glc_control import parse_args
+
+        config_paths.write_text(f"[gaii-control]\nencode_scale = {value}\n")
+        args = parse_args([])
+        assert args.encode_scale == expected
+        assert isinstance(args.encode_scale, float)
+        out = capsys.readouterr().out
+        if warning is None:
+            assert "Warning" not in out
+        else:
+            assert warning in out
+
+    def test_cli_encode_scale_is_clamped(self, config_paths, capsys):
+        """Test that an out-of-range --encode-scale is clamped with a warning."""
+        from glc_control import parse_args
+
+        assert parse_args(["--encode-scale", "0"]).encode_scale == 0.1
+        assert "encode_scale 0.0 out of range, using 0.1" in capsys.readouterr().out
@@ -19,23 +19,23 @@ class TestCreateFrame:
         assert img.size == (480, 480)
         assert img.mode == "RGB"
 
-    def test_create_frame_with_overlay(self, temp_image):
+    def test_create_frame_with_overlay(self, temp_background):
         """Test creating frame with overlay enabled."""
-        bg = load_background(temp_image)
+        bg = temp_background
         img = create_frame(bg_image=bg, show_overlay=True)
         assert img is not None
         assert img.size == (480, 480)
 
-    def test_create_frame_without_overlay(self, temp_image):
+    def test_create_frame_without_overlay(self, temp_background):
         """Test creating frame with overlay disabled."""
-        bg = load_background(temp_image)
+        bg = temp_background
         img = create_frame(bg_image=bg, show_overlay=False)
         assert img is not None
         assert img.size == (480, 480)
 
-    def test_create_frame_overlay_returns_background(self, temp_image):
+    def test_create_frame_overlay_returns_background(self, temp_background):
         """Test that frame without overlay returns background unchanged."""
-        bg = load_background(temp_image)
+        bg = temp_background
         img = create_frame(bg_image=bg, show_overlay=False)
         # Without overlay, should return the background image
         assert img.size == bg.size
@@ -79,8 +79,8 @@ class TestCreateFrame:
         bg = Image.new("RGB", (480, 480), color=(30, 30, 30))
         img = create_frame(bg_image=bg, show_overlay=True, overlay_opacity=180)
         # Check that image has some variation in pixels (text was drawn)
-        pixels = list(img.getdata())
-        unique_colors = set(pixels)
+        # getcolors() tallies distinct colors in C instead of building a tuple per pixel
+        unique_colors = img.getcolors(maxcolors=480 * 480)
         assert len(unique_colors) > 1, "Overlay should add text with different colors"
 
     def test_create_frame_default_background(self):
@@ -88,14 +88,16 @@ class TestCreateFrame:
         img = create_frame(bg_image=None, show_overlay=False)
         assert img is not None
         # Should be dark (30, 30, 30) background with darker rectangle
-        pixels = list(img.getdata())
         # Count dark pixels
-        dark_pixels = sum(1 for p in pixels if p[0] <= 30 and p[1] <= 30 and p[2] <= 30)
+        dark_pixels = sum(
+            count for count, (r, g, b) in img.getcolors(maxcolors=480 * 480)
+            if r <= 30 and g <= 30 and b <= 30
+        )
         assert dark_pixels > 0
 
-    def test_create_frame_with_different_opacity_values(self, temp_image):
+    def test_create_frame_with_different_opacity_values(self, temp_background):
         """Test that different opacity values produce different results."""
-        bg = load_background(temp_image)
+        bg = temp_background
         img1 = create_frame(bg_image=bg, show_overlay=True, overlay_opacity=100)
         img2 = create_frame(bg_image=bg, show_overlay=True, overlay_opacity=200)
         # Both should be valid
@@ -131,3 +133,149 @@ class TestCreateFrame:
         assert bg.size == (480, 480)
         img = create_frame(bg_image=bg, show_overlay=True)
         assert img.size == (480, 480)
+
+    def test_create_frame_loads_fonts_once(self, monkeypatch):
+        """Test that fonts are resolved on the first overlay frame only."""
+        from unittest.mock import Mock
+        from glc_control import image_processor
+
+        get_fonts = Mock(return_value={"path": None, "available": False})
+        monkeypatch.setattr(image_processor, "_overlay_fonts", None)
+        monkeypatch.setattr(image_processor, "_get_system_fonts", get_fonts)
+        create_frame(bg_image=None, show_overlay=True)
+        create_frame(bg_image=None, show_overlay=True)
+        assert get_fonts.call_count == 1
+
+    def test_create_frame_reuses_dark_background(self):
+        """Test that the dark theme is rendered once and left untouched by overlays."""
+        base1 = create_frame(bg_image=None, show_overlay=False)
+        base_bytes = base1.tobytes()
+        create_frame(bg_image=None, show_overlay=True)
+        base2 = create_frame(bg_image=None, show_overlay=False)
+        assert base2 is base1
+        assert base2.tobytes() == base_bytes
+        assert base2.getpixel((0, 0)) == (30, 30, 30)
+        assert base2.getpixel((240, 240)) == (10, 10, 10)
+
+    def test_static_date_layer_cached(self):
+        """Test that the date layer is reused until the date or background changes."""
+        from PIL import ImageFont
+        from glc_control.image_processor import _get_static_frame
+
+        font = ImageFont.load_default()
+        bg = Image.new("RGB", (480, 480), color=(20, 20, 20))
+        first = _get_static_frame(bg, "01.01.2026", font)
+        assert _get_static_frame(bg, "01.01.2026", font) is first
+        assert _get_static_frame(bg, "02.01.2026", font) is not first
+        other_bg = Image.new("RGB", (480, 480), color=(20, 20, 20))
+        assert _get_static_frame(other_bg, "02.01.2026", font).tobytes() != bg.tobytes()
+        # The source background itself is never drawn on
+        assert bg.tobytes() == Image.new("RGB", (480, 480), color=(20, 20, 20)).tobytes()
+
+    def test_clock_texts_formatted_once_per_second(self, monkeypatch):
+        """Test that time/date strings are reused within the same second."""
+        from glc_control import image_processor
+
+        monkeypatch.setattr(image_processor, "_last_clock_second", -1)
+        monkeypatch.setattr(image_processor, "_last_clock_minute", -1)
+        monkeypatch.setattr(image_processor.time, "time", lambda: 1767225600.25)
+        first = image_processor._get_clock_texts()
+        monkeypatch.setattr(image_processor.time, "time", lambda: 1767225600.75)
+        assert image_processor._get_clock_texts() == first
+        monkeypatch.setattr(image_processor.time, "time", lambda: 1767225601.0)
+        assert image_processor._get_clock_texts()[0] != first[0]
+        assert len(first[0]) == 8 and first[0][2] == ":"
+        assert len(first[1]) == 10 and first[1][2] == "."
+
+    @pytest.mark.parametrize("timestamp", [1767225599.5, 1767225600.0, 1767268799.9, 1772323201.0])
+    def test_clock_texts_match_strftime(self, monkeypatch, timestamp):
+        """Test that hand-built clock strings match strftime across minutes."""
+        from datetime import datetime
+        from glc_control import image_processor
+
+        monkeypatch.setattr(image_processor, "_last_clock_second", -1)
+        monkeypatch.setattr(image_processor, "_last_clock_minute", -1)
+        for offset in (0, 1, 61):
+            monkeypatch.setattr(image_processor.time, "time", lambda: timestamp + offset)
+            now = datetime.fromtimestamp(int(timestamp + offset))
+            assert image_processor._get_clock_texts() == (
+                now.strftime("%H:%M:%S"), now.strftime("%d.%m.%Y")
+            )
+
+    def test_create_frame_reuses_frame_buffer(self):
+        """Test that overlay frames share one buffer that is fully repainted."""
+        bg_a = Image.new("RGB", (480, 480), color=(200, 0, 0))
+        bg_b = Image.new("RGB", (480, 480), color=(0, 0, 200))
+        img_a = create_frame(bg_image=bg_a, show_overlay=True)
+        img_b = create_frame(bg_image=bg_b, show_overlay=True)
+        assert img_b is img_a
+        assert img_b.getpixel((0, 0)) == (0, 0, 200)
+        assert img_b.getpixel((479, 479)) == (0, 0, 200)
+        assert bg_a.getpixel((0, 0)) == (200, 0, 0)
+
+    def test_make_renderer_matches_create_frame(self, monkeypatch):
+        """Test that the specialized renderer draws the same frames as create_frame."""
+        from glc_control import image_processor, make_renderer
+
+        monkeypatch.setattr(image_processor.time, "time", lambda: 1767225600.25)
+        bg = Image.new("RGB", (480, 480), color=(10, 60, 10))
+
+        render = make_renderer(bg_image=bg, show_overlay=True)
+        assert render().tobytes() == create_frame(bg_image=bg, show_overlay=True).tobytes()
+
+        plain = make_renderer(bg_image=bg, show_overlay=False)
+        assert plain() is bg
+
+    def test_text_width_memoized(self):
+        """Test that text widths match Pillow's layout and are measured once."""
+        from unittest.mock import Mock
+        from PIL import ImageDraw, ImageFont
+        from glc_control.image_processor import _text_width
+
+        font = ImageFont.load_default()
+        draw = ImageDraw.Draw(Image.new("RGB", (480, 480)))
+        bbox = draw.textbbox((0, 0), "12:34:56", font=font)
+        assert _text_width(font, "12:34:56") == bbox[2] - bbox[0]
+
+        counting = Mock(wraps=font)
+        _text_width(counting, "42%")
+        _text_width(counting, "42%")
+        assert counting.getbbox.call_count == 1
+
+    def test_create_frame_non_rgb_background(self):
+        """Test that non-RGB backgrounds are converted once for the overlay."""
+        bg = Image.new("RGBA", (480, 480), color=(0, 120, 0, 255))
+        img = create_frame(bg_image=bg, show_overlay=True)
+        assert img.mode == "RGB"
+        assert img.getpixel((0, 0)) == (0, 120, 0)
+        assert bg.mode == "RGBA"
+
+    def test_draw_text_matches_pillow(self):
+        """Test that stamped text masks are pixel-identical to draw.text."""
+        from PIL import ImageDraw, ImageFont
+        from glc_control.render_utils import draw_text, _text_mask
+
+        font = ImageFont.load_default(size=40)
+        expected = Image.new("RGB", (480, 120), color=(30, 30, 30))
+        stamped = expected.copy()
+        for xy, text in (((10, 10), "12:34:56"), ((300, 60), "45°C"), ((200, 70), "99%")):
+            ImageDraw.Draw(expected).text(xy, text, fill=(0, 255, 200), font=font)
+            draw_text(ImageDraw.Draw(stamped), xy, text, fill=(0, 255, 200), font=font)
+        assert stamped.tobytes() == expected.tobytes()
+        assert _text_mask(font, "99%") is _text_mask(font, "99%")
+
+    def test_frame_buffer_restores_only_dirty_text(self, monkeypatch):
+        """Test that partial restores give the same frame as a full repaint."""
+        from glc_control import image_processor
+
+        bg = Image.linear_gradient("L").resize((480, 480)).convert("RGB")
+        monkeypatch.setattr(image_processor.time, "time", lambda: 1767225600.0)
+        create_frame(bg_image=bg, show_overlay=True)
+        monkeypatch.setattr(image_processor.time, "time", lambda: 1767225611.0)
+        monkeypatch.setattr(image_processor.psutil, "cpu_percent", lambda interval=None: 7.0)
+        monkeypatch.setattr(image_processor, "_last_cpu_percent", 0.0)
+        partial = create_frame(bg_image=bg, show_overlay=True).tobytes()
+
+        monkeypatch.setattr(image_processor, "_frame_source", None)
+        monkeypatch.setattr(image_processor, "_last_cpu_percent", 0.0)
+        assert create_frame(bg_image=bg, show_overlay=True).tobytes() == partial
@@ -7,20 +7,21 @@ from PIL import Image
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from glc_control import encode_h264
+from glc_control.config import H264_ENCODERS
 
 
 class TestEncodeH264:
     """Test H.264 encoding of images."""
 
-    def test_encode_h264_returns_bytes(self, temp_image):
+    def test_encode_h264_returns_bytes(self, temp_image_loaded):
         """Test that encode_h264 returns bytes."""
-        img = Image.open(temp_image)
+        img = temp_image_loaded
         h264_data = encode_h264(img)
         assert isinstance(h264_data, bytes)
 
-    def test_encode_h264_not_empty(self, temp_image):
+    def test_encode_h264_not_empty(self, temp_image_loaded):
         """Test that encode_h264 returns non-empty data."""
-        img = Image.open(temp_image)
+        img = temp_image_loaded
         h264_data = encode_h264(img)
         assert len(h264_data) > 0
 
@@ -54,9 +55,9 @@ class TestEncodeH264:
             assert isinstance(h264_data, bytes)
             assert len(h264_data) > 0
 
-    def test_encode_h264_has_h264_header(self, temp_image):
+    def test_encode_h264_has_h264_header(self, temp_image_loaded):
         """Test that encoded data starts with H.264 NAL unit headers."""
-        img = Image.open(temp_image)
+        img = temp_image_loaded
         h264_data = encode_h264(img)
         # H.264 frames typically start with NAL unit headers (0x00 0x00 0x00 0x01)
         # or contain them within the data
@@ -104,12 +105,10 @@ class TestEncodeH264:
 
     def test_encode_h264_gradient_image(self):
         """Test encoding gradient image (variable colors)."""
-        img = Image.new("RGB", (480, 480), color=(200, 100, 50))
-        # Draw some variation
-        pixels = img.load()
-        for i in range(0, 480, 10):
-            for j in range(0, 480, 10):
-                pixels[i, j] = ((i * 255) // 480, (j * 255) // 480, 128)
+        # Red ramps left to right, green top to bottom, over constant blue
+        green = Image.linear_gradient("L").resize((480, 480))
+        red = green.transpose(Image.Transpose.ROTATE_90)
+        img = Image.merge("RGB", (red, green, Image.new("L", (480, 480), 128)))
         h264_data = encode_h264(img)
         assert h264_data is not None
         assert len(h264_data) > 0
@@ -127,15 +126,224 @@ class TestEncodeH264:
         assert isinstance(h264_data, bytes)
         assert len(h264_data) > 0
 
-    def test_encode_h264_cleanup_temp_files(self, temp_image):
-        """Test that temporary files are cleaned up after encoding."""
+    def test_encode_h264_cleanup_temp_files(self, temp_image, tmp_path, monkeypatch):
+        """Test that encoding leaves no temporary files behind."""
         import tempfile
-        initial_temp_count = len(os.listdir(tempfile.gettempdir()))
 
         img = Image.open(temp_image)
+        # Point tempfile at an empty private directory so only files created
+        # by encode_h264 can show up, without scanning the shared temp dir
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        encode_h264(img)
+
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "P"])
+    def test_encode_h264_raw_pixel_modes(self, mode):
+        """Test that raw frames of any PIL mode are encoded without file formats."""
+        img = Image.new(mode, (480, 480))
         h264_data = encode_h264(img)
+        assert h264_data.startswith(b"\x00\x00\x00\x01\x67")
+
+    def test_encode_h264_reuses_encoder(self):
+        """Test that consecutive calls share one persistent encoder."""
+        from glc_control import image_processor
+
+        img = Image.new("RGB", (480, 480), color=(10, 20, 30))
+        encode_h264(img)
+        encoder = image_processor._h264_encoder
+        encode_h264(img)
+        assert encoder is not None
+        assert image_processor._h264_encoder is encoder
+
+    def test_encode_h264_every_frame_is_standalone(self):
+        """Test that each frame starts with its own SPS NAL unit."""
+        img = Image.new("RGB", (480, 480), color=(10, 20, 30))
+        for _ in range(3):
+            h264_data = encode_h264(img)
+            assert h264_data.startswith(b"\x00\x00\x00\x01\x67")
+
+    def test_encode_h264_preserves_colors(self):
+        """Test that the RGB to YUV420 conversion keeps solid colors intact."""
+        import av
+
+        color = (200, 40, 90)
+        h264_data = encode_h264(Image.new("RGB", (480, 480), color=color))
+        decoder = av.CodecContext.create("h264", "r")
+        packets = decoder.parse(h264_data) + decoder.parse(None)
+        frames = [f for p in packets for f in decoder.decode(p)] + decoder.decode(None)
+        pixel = frames[0].to_image().getpixel((240, 240))
+        assert all(abs(a - b) <= 6 for a, b in zip(pixel, color))
+
+    def test_encode_h264_at_reduced_scale(self):
+        """Test that a lower encode scale produces a smaller decoded frame."""
+        import av
+        from glc_control import close_encoder, image_processor
+
+        h264_data = encode_h264(Image.new("RGB", (480, 480), color=(0, 200, 0)), scale=0.5)
+        assert image_processor._h264_encode_size == (240, 240)
+        decoder = av.CodecContext.create("h264", "r")
+        packets = decoder.parse(h264_data) + decoder.parse(None)
+        frames = [f for p in packets for f in decoder.decode(p)] + decoder.decode(None)
+        assert (frames[0].width, frames[0].height) == (240, 240)
+
+        # Switching back to native size reopens the encoder
+        encode_h264(Image.new("RGB", (480, 480)))
+        assert image_processor._h264_encode_size == (480, 480)
+        close_encoder()
+
+    def test_identical_frame_returns_cached_payload(self, monkeypatch):
+        """Test that an unchanged image is not encoded again."""
+        from glc_control import image_processor
+
+        img = Image.new("RGB", (480, 480), color=(1, 2, 3))
+        first = encode_h264(img)
+        monkeypatch.setattr(image_processor.av.VideoFrame, "from_image", None)
+        assert encode_h264(img.copy()) is first
+
+    def test_changed_frame_is_encoded_again(self):
+        """Test that the cache is keyed on pixel content."""
+        img = Image.new("RGB", (480, 480), color=(1, 2, 3))
+        first = encode_h264(img)
+        img.putpixel((0, 0), (255, 255, 255))
+        assert encode_h264(img) != first
+
+    def test_encode_h264_batch_one_payload_per_image(self):
+        """Test that batch encoding returns standalone payloads in order."""
+        from glc_control import encode_h264_batch
+
+        images = [Image.new("RGB", (480, 480), color=(i * 60, 0, 0)) for i in range(4)]
+        payloads = encode_h264_batch(images)
+        assert len(payloads) == 4
+        assert all(p.startswith(b"\x00\x00\x00\x01\x67") for p in payloads)
+        assert payloads[-1] == encode_h264(images[-1])
+        assert encode_h264_batch([]) == []
+
+    def test_close_encoder_is_idempotent(self):
+        """Test that close_encoder can be called repeatedly and encoding resumes."""
+        from glc_control import close_encoder, image_processor
+
+        encode_h264(Image.new("RGB", (480, 480)))
+        close_encoder()
+        close_encoder()
+        assert image_processor._h264_encoder is None
+        assert len(encode_h264(Image.new("RGB", (480, 480)))) > 0
+
+    def test_encoder_closed_at_exit_registered_once(self, monkeypatch):
+        """Test that opening the encoder registers a single atexit flush."""
+        from glc_control import close_encoder, image_processor
+
+        registered = []
+        monkeypatch.setattr(image_processor.atexit, "register", registered.append)
+        monkeypatch.setattr(image_processor, "_h264_atexit_registered", False)
+        close_encoder()
+        encode_h264(Image.new("RGB", (480, 480)))
+        close_encoder()
+        encode_h264(Image.new("RGB", (480, 480)))
+        assert registered == [close_encoder]
+
+    def test_encode_h264_falls_back_to_next_encoder(self, monkeypatch):
+        """Test that an unusable preferred encoder falls back to libx264."""
+        from glc_control import close_encoder, image_processor
+
+        close_encoder()
+        monkeypatch.setattr(image_processor, "H264_ENCODERS", ["no_such_encoder", "libx264"])
+        h264_data = encode_h264(Image.new("RGB", (480, 480)))
+        assert image_processor._h264_encoder.name == "libx264"
+        assert len(h264_data) > 0
+        close_encoder()
+
+    def test_encode_h264_skips_encoders_missing_from_build(self, monkeypatch):
+        """Test that encoders not compiled into FFmpeg are never opened."""
+        import av
+        from glc_control import close_encoder, image_processor
+
+        close_encoder()
+        created = []
+        real_create = av.CodecContext.create
+        monkeypatch.setattr(image_processor, "H264_ENCODERS", ["h264_fake_hw", "libx264"])
+        monkeypatch.setattr(
+            image_processor.av.CodecContext, "create",
+            lambda name, mode: created.append(name) or real_create(name, mode),
+        )
+        encode_h264(Image.new("RGB", (480, 480)))
+        assert created == ["libx264"]
+        close_encoder()
+
+    def test_encoder_forces_baseline_profile(self):
+        """Test that the codec context profile is set for every encoder."""
+        from glc_control import close_encoder, image_processor
+
+        close_encoder()
+        encode_h264(Image.new("RGB", (480, 480)))
+        assert image_processor._h264_encoder.profile == "Baseline"
+        close_encoder()
+
+    def test_encode_h264_no_usable_encoder(self, monkeypatch):
+        """Test that a clear error is raised when no encoder can be opened."""
+        from glc_control import close_encoder, image_processor
+
+        close_encoder()
+        monkeypatch.setattr(image_processor, "H264_ENCODERS", ["no_such_encoder"])
+        with pytest.raises(RuntimeError, match="No usable H.264 encoder"):
+            encode_h264(Image.new("RGB", (480, 480)))
+
+    def test_buffering_encoder_returns_payload_for_each_frame(self, monkeypatch):
+        """Test that an encoder with lookahead still yields this frame's payload."""
+        import av
+        from glc_control import close_encoder, image_processor
+
+        close_encoder()
+        # libx264 without tune=zerolatency holds frames back in its lookahead
+        monkeypatch.setattr(image_processor, "H264_ENCODERS", ["libx264"])
+        monkeypatch.setattr(image_processor, "H264_ENCODER_OPTIONS", {"libx264": {"preset": "ultrafast"}})
+
+        colors = [(200, 0, 0), (0, 0, 200), (0, 0, 200), (200, 0, 0)]
+        for color in colors:
+            h264_data = encode_h264(Image.new("RGB", (480, 480), color=color))
+            assert h264_data
+
+            decoder = av.CodecContext.create("h264", "r")
+            packets = decoder.parse(h264_data) + decoder.parse(None)
+            frames = [f for p in packets for f in decoder.decode(p)] + decoder.decode(None)
+            pixel = frames[0].to_image().getpixel((240, 240))
+            assert all(abs(a - b) <= 6 for a, b in zip(pixel, color))
+
+        close_encoder()
+
+    def test_empty_payload_is_not_cached(self, monkeypatch):
+        """Test that a frame whose encode produced nothing is encoded again."""
+        from unittest.mock import Mock
+        from glc_control import close_encoder, image_processor
+
+        close_encoder()
+        ctx = Mock()
+        ctx.encode.return_value = []
+        monkeypatch.setattr(image_processor, "_open_h264_encoder", lambda size: ctx)
+
+        img = Image.new("RGB", (480, 480))
+        assert encode_h264(img) == b""
+        assert encode_h264(img) == b""
+        # Each call encodes the frame and then drains the encoder
+        assert ctx.encode.call_count == 4
+        assert ctx.encode.call_args.args == (None,)
+
+        close_encoder()
+
+    @pytest.mark.parametrize("codec_name", H264_ENCODERS)
+    def test_configured_encoder_emits_packet_per_frame(self, codec_name, monkeypatch):
+        """Test that each configured encoder returns a packet for every frame it is given."""
+        import av
+        from glc_control import image_processor
+
+        monkeypatch.setattr(image_processor, "H264_ENCODERS", [codec_name])
+        try:
+            ctx = image_processor._open_h264_encoder()
+        except RuntimeError as e:
+            pytest.skip(f"{codec_name} cannot be opened here: {e}")
 
-        # Temp directory shouldn't grow significantly (cleanup worked)
-        final_temp_count = len(os.listdir(tempfile.gettempdir()))
-        # Allow for some variance but not too many temp files left
-        assert (final_temp_count - initial_temp_count) < 10
+        for i in range(4):
+            frame = av.VideoFrame.from_image(Image.new("RGB", (480, 480), color=(i * 60, 0, 0)))
+            frame.pts = i
+            assert b"".join(bytes(p) for p in ctx.encode(frame))
+        ctx.encode(None)
@@ -0,0 +1,53 @@
+"""Tests for find_font() font resolution."""
+
+import pytest
+from unittest.mock import Mock
+from glc_control import render_utils
+from glc_control.render_utils import find_font, _load_fontconfig
+
+
+@pytest.fixture(autouse=True)
+def empty_font_cache(monkeypatch):
+    """Start every test with an empty font path cache."""
+    monkeypatch.setattr(render_utils, "_font_cache", {})
+
+
+@pytest.fixture
+def fc_match(monkeypatch):
+    """Replace subprocess.run with an fc-match stub."""
+    run = Mock(return_value=Mock(returncode=0, stdout="/usr/share/fonts/noto/NotoSansMono.ttf\n"))
+    monkeypatch.setattr(render_utils.subprocess, "run", run)
+    return run
+
+
+class TestFindFont:
+    """Test fontconfig lookups and their fallback."""
+
+    def test_falls_back_to_fc_match(self, fc_match):
+        """Test that fc-match is used when libfontconfig is unavailable."""
+        assert find_font("NotoSansMono") == "/usr/share/fonts/noto/NotoSansMono.ttf"
+        assert fc_match.call_args[0][0][0] == "fc-match"
+
+    def test_result_is_cached(self, fc_match):
+        """Test that each pattern is resolved only once."""
+        find_font("NotoSansMono")
+        find_font("NotoSansMono")
+        assert fc_match.call_count == 1
+
+    def test_uses_library_without_subprocess(self, monkeypatch, fc_match):
+        """Test that the in-process fontconfig lookup skips fc-match."""
+        monkeypatch.setattr(render_utils, "_load_fontconfig", lambda: ("lib", 1))
+        monkeypatch.setattr(
+            render_utils, "_fontconfig_match", lambda fc, pattern: f"/fonts/{pattern}.ttf"
+        )
+        assert find_font("NotoSans:weight=bold") == "/fonts/NotoSans:weight=bold.ttf"
+        assert fc_match.call_count == 0
+
+    def test_real_fontconfig_lookup(self, monkeypatch):
+        """Test a real libfontconfig match when the library is installed."""
+        monkeypatch.setattr(render_utils, "_fontconfig_loaded", False)
+        monkeypatch.setattr(render_utils, "_fontconfig", None)
+        fontconfig = _load_fontconfig()  # Real loader, imported before conftest patches it
+        if fontconfig is None:
+            pytest.skip("libfontconfig not available")
+        assert render_utils._fontconfig_match(fontconfig, "sans").startswith("/")
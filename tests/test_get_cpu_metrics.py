@@ -0,0 +1,116 @@
+"""Tests for _get_cpu_metrics() helper."""
+
+import pytest
+from glc_control import image_processor, render_utils
+from glc_control.image_processor import _get_cpu_metrics
+from glc_control.render_utils import _find_temp_input
+
+
+@pytest.fixture(autouse=True)
+def reset_metric_cache(monkeypatch):
+    """Start every test with an empty metrics cache."""
+    monkeypatch.setattr(image_processor, "_last_temp_ts", None)
+    monkeypatch.setattr(image_processor, "_last_temp_str", "N/A")
+    monkeypatch.setattr(image_processor, "_last_cpu_percent", 0.0)
+    monkeypatch.setattr(image_processor, "_last_cpu_ts", None)
+
+
+class TestGetCpuMetrics:
+    """Test CPU temperature/usage sampling."""
+
+    def test_returns_formatted_strings(self):
+        """Test that metrics are formatted for display."""
+        cpu_temp, cpu_percent = _get_cpu_metrics()
+        assert cpu_temp == "45°C"
+        assert cpu_percent == "50%"
+
+    def test_temperature_is_cached_between_frames(self, mock_psutil):
+        """Test that sensors are read once within the refresh interval."""
+        _get_cpu_metrics()
+        _get_cpu_metrics()
+        _get_cpu_metrics()
+        assert mock_psutil["temps"].call_count == 1
+
+    def test_temperature_refreshes_after_interval(self, mock_psutil, monkeypatch):
+        """Test that sensors are read again once the interval has elapsed."""
+        clock = iter([100.0, 100.5, 101.5])
+        monkeypatch.setattr(image_processor.time, "monotonic", lambda: next(clock))
+        _get_cpu_metrics()
+        _get_cpu_metrics()
+        assert mock_psutil["temps"].call_count == 1
+        _get_cpu_metrics()
+        assert mock_psutil["temps"].call_count == 2
+
+    def test_cpu_usage_rate_limited(self, mock_psutil, monkeypatch):
+        """Test that /proc/stat is read at most once per refresh interval."""
+        clock = iter([100.0, 100.05, 100.15, 100.2])
+        monkeypatch.setattr(image_processor.time, "monotonic", lambda: next(clock))
+        _get_cpu_metrics()
+        mock_psutil["cpu"].return_value = 90.0
+        assert _get_cpu_metrics()[1] == "50%"
+        assert mock_psutil["cpu"].call_count == 1
+        assert _get_cpu_metrics()[1] == "62%"  # 0.7 * 50 + 0.3 * 90
+        _get_cpu_metrics()
+        assert mock_psutil["cpu"].call_count == 2
+
+    def test_missing_sensor_reports_na(self, mock_psutil):
+        """Test that unknown sensors fall back to N/A."""
+        mock_psutil["temps"].return_value = {}
+        cpu_temp, _ = _get_cpu_metrics()
+        assert cpu_temp == "N/A"
+
+
+@pytest.fixture
+def hwmon(tmp_path, monkeypatch):
+    """Build a fake /sys/class/hwmon tree and search it from scratch."""
+    def add(entry, name, readings):
+        device = tmp_path / entry
+        device.mkdir()
+        (device / "name").write_text(f"{name}\n")
+        for index, millideg in readings.items():
+            (device / f"temp{index}_input").write_text(f"{millideg}\n")
+            (device / f"temp{index}_label").write_text("Sensor\n")
+
+    monkeypatch.setattr(render_utils, "HWMON_PATH", str(tmp_path))
+    monkeypatch.setattr(render_utils, "_temp_input_path", None)
+    monkeypatch.setattr(render_utils, "_temp_input_searched", False)
+    monkeypatch.setattr(render_utils, "_find_temp_input", _find_temp_input)
+    return add
+
+
+class TestSysfsTemperature:
+    """Test reading CPU temperature straight from hwmon sysfs files."""
+
+    def test_reads_sysfs_without_psutil(self, hwmon, mock_psutil):
+        """Test that a matching hwmon device is read directly."""
+        hwmon("hwmon0", "acpitz", {1: 27800})
+        hwmon("hwmon1", "coretemp", {10: 51000, 2: 48000, 1: 62500})
+        cpu_temp, _ = _get_cpu_metrics()
+        assert cpu_temp == "62°C"
+        assert mock_psutil["temps"].call_count == 0
+
+    def test_sensor_priority_follows_config(self, hwmon):
+        """Test that TEMP_SENSORS order wins over hwmon numbering."""
+        hwmon("hwmon0", "k10temp", {1: 40000})
+        hwmon("hwmon1", "coretemp", {1: 55000})
+        assert _find_temp_input().endswith("hwmon1/temp1_input")
+
+    def test_duplicate_sensor_follows_device_numbering(self, hwmon):
+        """Test that hwmon2 is preferred over hwmon10 for the same sensor name."""
+        hwmon("hwmon10", "coretemp", {1: 40000})
+        hwmon("hwmon2", "coretemp", {1: 55000})
+        assert _find_temp_input().endswith("hwmon2/temp1_input")
+
+    def test_device_searched_once(self, hwmon, monkeypatch):
+        """Test that the hwmon tree is walked only on the first lookup."""
+        hwmon("hwmon0", "coretemp", {1: 55000})
+        path = _find_temp_input()
+        monkeypatch.setattr(render_utils, "HWMON_PATH", "/nonexistent")
+        assert _find_temp_input() == path
+
+    def test_falls_back_to_psutil(self, hwmon, mock_psutil):
+        """Test that psutil is used when no hwmon device matches."""
+        hwmon("hwmon0", "nvme", {1: 35000})
+        cpu_temp, _ = _get_cpu_metrics()
+        assert cpu_temp == "45°C"
+        assert mock_psutil["temps"].call_count == 1
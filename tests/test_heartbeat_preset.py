@@ -0,0 +1,52 @@
+"""Tests for HeartbeatPreset rendering."""
+
+import random
+
+from PIL import Image, ImageDraw
+from glc_control.presets import HeartbeatPreset
+
+
+class TestHeartbeatPreset:
+    """Test HeartbeatPreset rendering."""
+
+    def test_heartbeat_render_returns_display_frame(self):
+        """Test that render() returns a 480x480 RGB image."""
+        preset = HeartbeatPreset()
+        img = preset.render()
+        assert img.size == (480, 480)
+        assert img.mode == "RGB"
+
+    def test_heartbeat_bar_size_depends_only_on_tallest_block(self):
+        """Test that bars sharing a tallest block measure the same."""
+        preset = HeartbeatPreset()
+        draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        rng = random.Random(0)
+
+        for _ in range(200):
+            right = "".join(rng.choice(preset.blocks) for _ in range(8))
+            bar_string = "|" + right[::-1] + right + "|"
+            bbox = draw.textbbox((0, 0), bar_string, font=preset.bar_font)
+            size = preset._text_size(preset._bar_sizes, max(right), bar_string, preset.bar_font)
+            assert size == (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+    def test_heartbeat_cpu_load_sampled_by_time(self, monkeypatch):
+        """Test that psutil is sampled once per CPU_REFRESH_INTERVAL_S, not per frame."""
+        from glc_control import presets
+        from glc_control.config import CPU_REFRESH_INTERVAL_S
+
+        clock = [100.0]
+        readings = iter([20.0, 40.0])
+        monkeypatch.setattr(presets.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(presets.psutil, "cpu_percent", lambda interval: next(readings))
+
+        preset = HeartbeatPreset()
+        preset.current_cpu = preset._get_cpu_load()
+        assert preset.current_cpu == 20.0
+
+        # Any number of frames within the interval reuse the last value
+        clock[0] += CPU_REFRESH_INTERVAL_S / 2
+        for _ in range(10):
+            assert preset._get_cpu_load() == 20.0
+
+        clock[0] += CPU_REFRESH_INTERVAL_S
+        assert preset._get_cpu_load() == 30.0
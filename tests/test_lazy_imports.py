@@ -0,0 +1,50 @@
+"""Tests for lazy loading of the glc_control package."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import glc_control
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImports:
+    """Test that heavy modules are only imported on demand."""
+
+    def test_cli_import_skips_heavy_modules(self):
+        """Test that importing the package for CLI parsing avoids PIL/av/usb."""
+        code = (
+            "import sys, glc_control; glc_control.parse_args([], load_config_file=False); "
+            "print(','.join(m for m in ('PIL', 'av', 'psutil', 'usb') if m in sys.modules))"
+        )
+        # Popen rather than run(): the shared fixtures mock subprocess.run
+        proc = subprocess.Popen(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, stdout=subprocess.PIPE, text=True
+        )
+        stdout, _ = proc.communicate(timeout=60)
+        assert proc.returncode == 0
+        assert stdout.strip() == ""
+
+    def test_presets_import_skips_encoder(self):
+        """Test that importing the presets does not load PyAV."""
+        code = "import sys, glc_control.presets; print('av' in sys.modules)"
+        proc = subprocess.Popen(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, stdout=subprocess.PIPE, text=True
+        )
+        stdout, _ = proc.communicate(timeout=60)
+        assert proc.returncode == 0
+        assert stdout.strip() == "False"
+
+    @pytest.mark.parametrize("name", ["encode_h264", "create_frame", "MatrixPreset", "send_h264_frame"])
+    def test_lazy_attributes_resolve(self, name):
+        """Test that lazily exported names resolve to the real objects."""
+        assert getattr(glc_control, name) is not None
+        assert name in dir(glc_control)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            glc_control.does_not_exist
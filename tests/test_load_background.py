@@ -87,8 +87,9 @@ class TestLoadBackground:
             # Image should still be 480x480, with black bars
             assert result.size == (480, 480)
             # Check that there are black bars (some pixels should be black)
-            pixels = result.getdata()
-            black_pixels = sum(1 for p in pixels if p == (0, 0, 0))
+            black_pixels = sum(
+                count for count, color in result.getcolors(maxcolors=480 * 480) if color == (0, 0, 0)
+            )
             assert black_pixels > 0, "Fit mode should add black bars"
         finally:
             try:
@@ -155,6 +156,29 @@ class TestLoadBackground:
             except:
                 pass
 
+    def test_load_large_jpeg_uses_draft(self):
+        """Test that large JPEGs are draft-decoded but still fill the display."""
+        from unittest.mock import patch
+        from PIL import JpegImagePlugin
+        jpeg_img = Image.new("RGB", (2400, 1600), color=(0, 128, 255))
+        import tempfile
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
+            jpeg_img.save(f.name, format="JPEG")
+            temp_path = f.name
+
+        try:
+            draft = JpegImagePlugin.JpegImageFile.draft
+            with patch.object(JpegImagePlugin.JpegImageFile, "draft", autospec=True, side_effect=draft) as mock_draft:
+                result = load_background(temp_path, mode="stretch")
+            assert mock_draft.called
+            assert mock_draft.call_args[0][1:] == ("RGB", (480, 480))
+            assert result.size == (480, 480)
+        finally:
+            try:
+                os.unlink(temp_path)
+            except:
+                pass
+
     def test_square_image_in_fit_mode(self):
         """Test square image in fit mode."""
         square_img = Image.new("RGB", (480, 480), color=(100, 100, 100))
@@ -171,3 +195,20 @@ class TestLoadBackground:
                 os.unlink(temp_path)
             except:
                 pass
+
+    @pytest.mark.parametrize("high_quality, expected", [
+        (False, Image.Resampling.BILINEAR),
+        (True, Image.Resampling.LANCZOS),
+    ])
+    def test_resample_filter_follows_quality_flag(self, temp_image, monkeypatch, high_quality, expected):
+        """Test that backgrounds use bilinear unless HIGH_QUALITY_BG is set."""
+        from unittest.mock import patch
+        from glc_control import image_processor
+
+        monkeypatch.setattr(image_processor, "HIGH_QUALITY_BG", high_quality)
+        monkeypatch.setattr(image_processor, "_bg_image_cache_key", None)
+        resize = Image.Image.resize
+        with patch.object(Image.Image, "resize", autospec=True, side_effect=resize) as mock_resize:
+            result = load_background(temp_image, mode="stretch")
+        assert mock_resize.call_args[0][2] == expected
+        assert result.size == (480, 480)
@@ -52,43 +52,40 @@ class TestMatrixPreset:
         preset = MatrixPreset()
         img = preset.render()
         
-        pixels = list(img.getdata())
-        
-        # Count green vs black pixels
+        # Count green vs black pixels, one entry per distinct color
         green_count = 0
         black_count = 0
         
-        for r, g, b in pixels:
+        for count, (r, g, b) in img.getcolors(maxcolors=480 * 480):
             # Green: high G, low R and B
             if g > 50 and r < 100 and b < 100:
-                green_count += 1
+                green_count += count
             # Black: all channels low
             elif r < 30 and g < 30 and b < 30:
-                black_count += 1
+                black_count += count
         
         # Should have some green pixels for the falling characters
         assert green_count > 50, f"Expected > 100 green pixels, got {green_count}"
         
         # Most pixels should be black background
-        assert black_count > len(pixels) * 0.5, "Expected > 50% black background"
+        assert black_count > img.width * img.height * 0.5, "Expected > 50% black background"
 
     def test_matrix_animation_state_changes(self):
         """Test that animation state progresses between frames."""
         preset = MatrixPreset(fps=20.0)  # Faster FPS for more visible changes
         
         # Get initial positions
-        initial_positions = {i: col['y'] for i, col in preset.columns.items()}
+        initial_positions = list(preset.col_y)
         
         # Render multiple times to advance animation
         for _ in range(10):
             preset.render()
         
         # Get final positions
-        final_positions = {i: col['y'] for i, col in preset.columns.items()}
+        final_positions = list(preset.col_y)
         
         # At least some columns should have changed position
-        changed = sum(1 for i in initial_positions 
-                     if initial_positions[i] != final_positions[i])
+        changed = sum(1 for a, b in zip(initial_positions, final_positions) if a != b)
         
         assert changed > 0, "Animation positions did not change"
 
@@ -121,14 +118,14 @@ class TestMatrixPreset:
         preset = MatrixPreset(fps=10.0)
         
         # Force a column far below the screen to trigger reset
-        preset.columns[0]['y'] = 1000
+        preset.col_y[0] = 1000
         
         # Render to trigger reset (which happens when y > height + 100 = 580)
         preset.render()
         
         # After reset, column should be back at top (between -200 and 0)
-        assert -200 <= preset.columns[0]['y'] <= 0, \
-            f"Column should reset to top range [-200, 0], got {preset.columns[0]['y']}"
+        assert -200 <= preset.col_y[0] <= 0, \
+            f"Column should reset to top range [-200, 0], got {preset.col_y[0]}"
 
     def test_matrix_frame_count_increments(self):
         """Test that frame counter increments."""
@@ -148,3 +145,116 @@ class TestMatrixPreset:
             img = preset.render()
             assert img.size == (480, 480), f"Failed for fps={fps}"
             assert img.mode == "RGB", f"Failed for fps={fps}"
+
+    def test_matrix_temperature_box_without_blend(self):
+        """Test that the temperature box and dimmed trails match the old blend look."""
+        preset = MatrixPreset()
+        preset.col_y = [-1000] * preset.col_count  # Keep every trail off screen
+
+        img = preset.render()
+        colors = {color for _, color in img.getcolors(maxcolors=480 * 480)}
+
+        assert (0, 9, 0) in colors  # 30% of (0, 30, 0) over black
+        assert max(g for _, g, _ in colors) > 178  # Temperature text above the trails
+        assert img.getpixel((0, 0)) == (0, 0, 0)
+        assert preset._interpolate_color(1.0) == (0, 178, 0)  # 70% of full green
+
+    def test_matrix_glyph_cache_matches_draw_text(self):
+        """Test that stamped glyphs are pixel-identical to draw.text output."""
+        from PIL import ImageDraw
+
+        preset = MatrixPreset()
+        assert set(preset.glyphs) == set(preset.char_pool)
+
+        expected = Image.new("RGB", (60, 30))
+        stamped = Image.new("RGB", (60, 30))
+        for x, char in enumerate("aZ7g"):
+            ImageDraw.Draw(expected).text((x * 12 + 2, 5), char, fill=(0, 178, 0), font=preset.font)
+            mask, dx, dy = preset.glyphs[char]
+            ImageDraw.Draw(stamped).bitmap((x * 12 + 2 + dx, 5 + dy), mask, fill=(0, 178, 0))
+        assert stamped.tobytes() == expected.tobytes()
+
+    def test_matrix_trail_strips_match_per_glyph_drawing(self):
+        """Test that pasted trail strips equal drawing every cell separately."""
+        from PIL import ImageDraw
+
+        preset = MatrixPreset()
+        preset._get_cpu_temp = lambda: ""
+        preset.col_speed = [2] * preset.col_count
+        preset.col_y = [col_idx * 11 - 20 for col_idx in range(preset.col_count)]
+        img = preset.render()
+
+        expected = Image.new("RGB", (480, 480))
+        draw = ImageDraw.Draw(expected)
+        for col_idx in range(preset.col_count):
+            mask, dx, dy = preset.glyphs[preset.col_char[col_idx]]
+            trail_length = preset.col_trail[col_idx]
+            for i in range(trail_length):
+                y_pos = preset.col_y[col_idx] - i * preset.cell_height
+                if -20 < y_pos < 500:
+                    color = preset._interpolate_color(1.0 - i / trail_length)
+                    draw.bitmap((col_idx * 10 + 2 + dx, y_pos + dy), mask, fill=color)
+
+        # Ignore the temperature box in the middle
+        for frame in (img, expected):
+            frame.paste((0, 0, 0), (220, 220, 260, 260))
+        assert img.tobytes() == expected.tobytes()
+
+    def test_matrix_cpu_temperature_is_cached_between_frames(self, monkeypatch):
+        """Test that the sensor is only re-read once the refresh interval passes."""
+        from glc_control import presets
+
+        reads = []
+        clock = [100.0]
+        monkeypatch.setattr(presets, "read_cpu_temp", lambda: reads.append(1) or 50.0 + len(reads))
+        monkeypatch.setattr(presets.time, "monotonic", lambda: clock[0])
+        preset = MatrixPreset()
+
+        assert preset._get_cpu_temp() == "51°C"
+        clock[0] += presets.TEMP_REFRESH_INTERVAL_S / 2
+        assert preset._get_cpu_temp() == "51°C"
+        assert len(reads) == 1
+
+        clock[0] += presets.TEMP_REFRESH_INTERVAL_S
+        assert preset._get_cpu_temp() == "52°C"
+        assert len(reads) == 2
+
+    def test_preset_fonts_are_loaded_once(self, monkeypatch):
+        """Test that repeated font lookups reuse the cached font object."""
+        from glc_control import presets
+
+        lookups = []
+        monkeypatch.setattr(presets, "_font_cache", {})
+        monkeypatch.setattr(presets, "find_font", lambda pattern: lookups.append(pattern))
+
+        assert presets._get_font("NotoSansMono", 12) is None
+        assert presets._get_font("NotoSansMono", 12) is None
+        assert lookups == ["NotoSansMono"]
+
+        MatrixPreset()
+        MatrixPreset()
+        assert len(lookups) == 2
+
+    def test_matrix_temp_layout_measured_once_per_text(self):
+        """Test that the temperature layout is reused until the text changes."""
+        preset = MatrixPreset()
+        preset._get_cpu_temp = lambda: "45°C"
+        preset.render()
+        layout = preset._temp_layout
+        preset.render()
+        assert preset._temp_layout is layout
+
+        preset._get_cpu_temp = lambda: "100°C"
+        preset.render()
+        assert preset._temp_layout[0] == "100°C"
+        assert preset._temp_layout[2][2] - preset._temp_layout[2][0] > layout[2][2] - layout[2][0]
+
+    def test_matrix_reuses_frame_image(self):
+        """Test that render() redraws one persistent image from a cleared state."""
+        preset = MatrixPreset()
+        first = preset.render()
+        first.paste((255, 0, 0), (0, 0, 480, 480))
+
+        second = preset.render()
+        assert second is first
+        assert second.getpixel((0, 0)) != (255, 0, 0)
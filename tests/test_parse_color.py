@@ -12,107 +12,6 @@ from glc_control import parse_color
 class TestParseColor:
     """Test color parsing in hex, RGB, and named color formats."""
 
-    # ========== Named Color Tests ==========
-    def test_named_color_red(self):
-        """Test named color 'red'."""
-        result = parse_color("red")
-        assert result == (255, 0, 0)
-
-    def test_named_color_blue(self):
-        """Test named color 'blue'."""
-        result = parse_color("blue")
-        assert result == (0, 0, 255)
-
-    def test_named_color_green(self):
-        """Test named color 'green'."""
-        result = parse_color("green")
-        assert result == (0, 255, 0)
-
-    def test_named_color_yellow(self):
-        """Test named color 'yellow'."""
-        result = parse_color("yellow")
-        assert result == (255, 255, 0)
-
-    def test_named_color_cyan(self):
-        """Test named color 'cyan'."""
-        result = parse_color("cyan")
-        assert result == (0, 255, 255)
-
-    def test_named_color_magenta(self):
-        """Test named color 'magenta'."""
-        result = parse_color("magenta")
-        assert result == (255, 0, 255)
-
-    def test_named_color_white(self):
-        """Test named color 'white'."""
-        result = parse_color("white")
-        assert result == (255, 255, 255)
-
-    def test_named_color_black(self):
-        """Test named color 'black'."""
-        result = parse_color("black")
-        assert result == (0, 0, 0)
-
-    def test_named_color_gray(self):
-        """Test named color 'gray'."""
-        result = parse_color("gray")
-        assert result == (128, 128, 128)
-
-    def test_named_color_grey(self):
-        """Test named color 'grey' (alias for gray)."""
-        result = parse_color("grey")
-        assert result == (128, 128, 128)
-
-    def test_named_color_bright_red(self):
-        """Test named color 'bright_red'."""
-        result = parse_color("bright_red")
-        assert result == (255, 64, 64)
-
-    def test_named_color_bright_green(self):
-        """Test named color 'bright_green'."""
-        result = parse_color("bright_green")
-        assert result == (64, 255, 64)
-
-    def test_named_color_bright_blue(self):
-        """Test named color 'bright_blue'."""
-        result = parse_color("bright_blue")
-        assert result == (64, 64, 255)
-
-    def test_named_color_bright_yellow(self):
-        """Test named color 'bright_yellow'."""
-        result = parse_color("bright_yellow")
-        assert result == (255, 255, 64)
-
-    def test_named_color_bright_cyan(self):
-        """Test named color 'bright_cyan'."""
-        result = parse_color("bright_cyan")
-        assert result == (64, 255, 255)
-
-    def test_named_color_bright_magenta(self):
-        """Test named color 'bright_magenta'."""
-        result = parse_color("bright_magenta")
-        assert result == (255, 64, 255)
-
-    def test_named_color_bright_white(self):
-        """Test named color 'bright_white'."""
-        result = parse_color("bright_white")
-        assert result == (255, 255, 255)
-
-    def test_named_color_case_insensitive_uppercase(self):
-        """Test that color names are case-insensitive (uppercase)."""
-        result = parse_color("BLUE")
-        assert result == (0, 0, 255)
-
-    def test_named_color_case_insensitive_mixed(self):
-        """Test that color names are case-insensitive (mixed case)."""
-        result = parse_color("BrIgHt_ReD")
-        assert result == (255, 64, 64)
-
-    def test_named_color_with_whitespace(self):
-        """Test that whitespace around color name is trimmed."""
-        result = parse_color("  red  ")
-        assert result == (255, 0, 0)
-
     # ========== Hex Color Tests ==========
     def test_hex_color_with_hash(self):
         """Test hex color with # prefix."""
@@ -234,14 +133,23 @@ class TestParseColor:
         ("bright_red", (255, 64, 64)),
         ("bright_green", (64, 255, 64)),
         ("bright_blue", (64, 64, 255)),
+        ("bright_yellow", (255, 255, 64)),
+        ("bright_cyan", (64, 255, 255)),
+        ("bright_magenta", (255, 64, 255)),
+        ("bright_white", (255, 255, 255)),
         ("BLUE", (0, 0, 255)),  # Case insensitive
         ("ReD", (255, 0, 0)),   # Case insensitive
+        ("BrIgHt_ReD", (255, 64, 64)),  # Case insensitive
+        ("  red  ", (255, 0, 0)),  # Surrounding whitespace
         # Hex colors
         ("#FF0000", (255, 0, 0)),
         ("00FF00", (0, 255, 0)),
         ("0,0,255", (0, 0, 255)),
         ("#00FFC8", (0, 255, 200)),
         ("255, 255, 255", (255, 255, 255)),
+        ("0 ,128 , 255", (0, 128, 255)),
+        ("0255,0,0", (255, 0, 0)),  # Leading zeros
+        ("007, 000, 0010", (7, 0, 10)),
     ])
     def test_valid_colors_parametrized(self, color_input, expected):
         """Test various valid color formats including named colors."""
@@ -250,12 +158,30 @@ class TestParseColor:
     @pytest.mark.parametrize("invalid_color", [
         "#GG0000",
         "256,0,0",
+        "0256,0,0",
         "255,255",
         "invalid",
         "#12345",
         "12345G",
+        "+1,0,0",
+        "1,,0",
+        "#FF00 00",
     ])
     def test_invalid_colors_parametrized(self, invalid_color):
         """Test various invalid color formats."""
         with pytest.raises(argparse.ArgumentTypeError):
             parse_color(invalid_color)
+
+    def test_parse_color_memoized(self):
+        """Test that repeated inputs are served from the cache."""
+        parse_color.cache_clear()
+        assert parse_color("bright_cyan") == (64, 255, 255)
+        assert parse_color("bright_cyan") == (64, 255, 255)
+        info = parse_color.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_parse_color_invalid_not_cached(self):
+        """Test that invalid input raises on every call."""
+        for _ in range(2):
+            with pytest.raises(argparse.ArgumentTypeError):
+                parse_color("not-a-color")
@@ -70,7 +70,7 @@ class TestSendH264Frame:
         packet = bytearray(call_args[0][0])
         
         # Bytes 2-5 encode the total length
-        encoded_length = (packet[2] << 24) | (packet[3] << 16) | (packet[4] << 8) | packet[5]
+        encoded_length = int.from_bytes(packet[2:6], "big")
         assert encoded_length == len(sample_h264_data)
 
     def test_send_h264_frame_sequence_number(self, mock_usb_endpoint):
@@ -82,7 +82,7 @@ class TestSendH264Frame:
         sequences = []
         for call in mock_usb_endpoint.write.call_args_list:
             packet = bytearray(call[0][0])
-            seq = (packet[6] << 16) | (packet[7] << 8) | packet[8]
+            seq = int.from_bytes(packet[6:9], "big")
             sequences.append(seq)
         
         # Sequences should increment
@@ -96,7 +96,7 @@ class TestSendH264Frame:
         
         for call in mock_usb_endpoint.write.call_args_list:
             packet = bytearray(call[0][0])
-            chunk_len = (packet[9] << 8) | packet[10]
+            chunk_len = int.from_bytes(packet[9:11], "big")
             # Chunk length should be > 0 and <= 1013
             assert 0 < chunk_len <= 1013
 
@@ -158,7 +158,7 @@ class TestSendH264Frame:
         total_payload = b""
         for call in mock_usb_endpoint.write.call_args_list:
             packet = bytearray(call[0][0])
-            chunk_len = (packet[9] << 8) | packet[10]
+            chunk_len = int.from_bytes(packet[9:11], "big")
             payload = bytes(packet[11:11 + chunk_len])
             total_payload += payload
         
@@ -183,3 +183,33 @@ class TestSendH264Frame:
         
         # Packet must be at least 11 bytes (header + at least some payload)
         assert len(packet) >= 1024
+
+    def test_send_h264_frame_idles_after_each_write(self, mock_usb_endpoint, monkeypatch):
+        """Test that the full gap is kept after a write returns, however long it took."""
+        from glc_control import usb_device
+
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        # Each write takes 0.4 ms, which does not count toward the 1 ms gap
+        mock_usb_endpoint.write.side_effect = lambda *a, **kw: clock.__setitem__(0, clock[0] + 0.0004)
+        monkeypatch.setattr(usb_device.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(usb_device.time, "sleep", fake_sleep)
+
+        send_h264_frame(mock_usb_endpoint, b"\x00" * 3000)
+
+        assert mock_usb_endpoint.write.call_count == 3
+        assert sleeps == pytest.approx([0.001, 0.001])
+
+    def test_send_h264_frame_single_packet_does_not_sleep(self, mock_usb_endpoint, monkeypatch):
+        """Test that no delay follows the last packet."""
+        from glc_control import usb_device
+
+        sleeps = []
+        monkeypatch.setattr(usb_device.time, "sleep", sleeps.append)
+        send_h264_frame(mock_usb_endpoint, b"\x00" * 100)
+        assert sleeps == []
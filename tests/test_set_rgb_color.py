@@ -0,0 +1,26 @@
+"""Tests for set_rgb_color() function."""
+
+from glc_control import set_rgb_color
+
+
+class TestSetRgbColor:
+    """Test RGB pump color packets."""
+
+    def test_set_rgb_color_packet_layout(self, mock_usb_endpoint):
+        """Test that the packet carries the header, payload header and color."""
+        set_rgb_color(mock_usb_endpoint, (10, 20, 30))
+
+        packet = mock_usb_endpoint.write.call_args[0][0]
+        assert isinstance(packet, bytes)
+        assert len(packet) == 64
+        assert packet[:13] == bytes([0x01, 0x83, 0, 0, 0, 19, 0x00, 0x03, 0x04, 0x00, 10, 20, 30])
+        assert packet[13:] == bytes(51)
+        assert mock_usb_endpoint.write.call_args[1]["timeout"] == 1000
+
+    def test_set_rgb_color_does_not_leak_previous_color(self, mock_usb_endpoint):
+        """Test that consecutive calls each start from a clean template."""
+        set_rgb_color(mock_usb_endpoint, (255, 255, 255))
+        set_rgb_color(mock_usb_endpoint, (0, 0, 0))
+
+        packet = mock_usb_endpoint.write.call_args[0][0]
+        assert packet[10:13] == b"\x00\x00\x00"